@@ -5,7 +5,7 @@ import logging
 import sys
 from pathlib import Path
 
-from .server import OrchestratorServer
+from .server import OrchestratorServer, load_config
 
 
 def setup_logging(config: dict):
@@ -23,11 +23,14 @@ async def main():
     # Determine config path
     config_path = Path(__file__).parent.parent.parent / "config" / "config.yaml"
 
-    # Create server (will load config)
-    server = OrchestratorServer(str(config_path))
+    # Load config once and share it with the server
+    config = load_config(str(config_path))
 
     # Setup logging
-    setup_logging(server.config)
+    setup_logging(config)
+
+    # Create server
+    server = OrchestratorServer(str(config_path), config=config)
 
     # Run server
     await server.run()
@@ -0,0 +1,107 @@
+"""Coalescing of concurrent calls into batches."""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBatcher:
+    """Collects concurrently submitted items and processes them in batches."""
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[Any]], Awaitable[List[Any]]],
+        max_batch: int = 32,
+        queue_size: int = 128,
+        max_wait_ms: int = 10,
+    ):
+        """
+        Initialize batcher.
+
+        Args:
+            process_batch: Async function processing a list of items; returns one
+                result per item, in order (an exception instance fails only its item)
+            max_batch: Maximum number of items per batch
+            queue_size: Maximum number of pending items before submitters wait
+            max_wait_ms: Time to wait for more items after the first one of a batch
+        """
+        self._process_batch = process_batch
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+
+        self._queue: asyncio.Queue[Tuple[Any, asyncio.Future]] = asyncio.Queue(queue_size)
+        self._worker: Optional[asyncio.Task] = None
+        # Batches being processed, referenced until done
+        self._dispatches: Set[asyncio.Task] = set()
+
+    async def run(self, item: Any) -> Any:
+        """
+        Submit an item and wait for its result.
+
+        Args:
+            item: Item to process
+
+        Returns:
+            Result for the item
+
+        Raises:
+            Exception: Whatever processing raised for the item or its batch
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._work())
+        return await future
+
+    async def _work(self):
+        """Collect batches until the queue runs dry."""
+        loop = asyncio.get_running_loop()
+        while not self._queue.empty():
+            batch = [self._queue.get_nowait()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # Process in the background, so a slow batch doesn't hold up the next one
+            task = asyncio.create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, batch: List[Tuple[Any, asyncio.Future]]):
+        """
+        Process a batch and fan results back out to their futures.
+
+        Args:
+            batch: Pairs of (item, future)
+        """
+        try:
+            results = await self._process_batch([item for item, _ in batch])
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            logger.debug(f"Batch of {len(batch)} items failed: {e!r}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -1,12 +1,173 @@
 """Metadata cache manager."""
 
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+import math
+import sqlite3
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import TypeAdapter
 
 from .models import CachedItem, ServerMetadata, Tool
 
 logger = logging.getLogger(__name__)
 
+# Serializers used to persist and rehydrate each cache kind
+_ADAPTERS: Dict[str, TypeAdapter] = {
+    "servers": TypeAdapter(list[ServerMetadata]),
+    "server metadata": TypeAdapter(Optional[ServerMetadata]),
+    "server tools": TypeAdapter(list[Tool]),
+    "all tools": TypeAdapter(Dict[str, list[Tool]]),
+    "server prompt": TypeAdapter(Optional[str]),
+}
+
+
+class DiskStore:
+    """
+    SQLite-backed persistent store for cache entries.
+
+    All statements run on a single worker thread, so the event loop never waits on
+    disk I/O and operations apply in the order they were issued.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize disk store.
+
+        Args:
+            path: Path to SQLite database file
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cache-store")
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache "
+            "(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL)"
+        )
+
+    async def get(self, key: str) -> Optional[Tuple[bytes, Optional[float]]]:
+        """
+        Get a stored value.
+
+        Args:
+            key: Entry key
+
+        Returns:
+            Tuple of (value, remaining TTL in seconds or None if permanent),
+            or None if missing or expired
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self._get, key)
+
+    def _get(self, key: str) -> Optional[Tuple[bytes, Optional[float]]]:
+        """
+        Get a stored value on the worker thread.
+
+        Args:
+            key: Entry key
+
+        Returns:
+            Tuple of (value, remaining TTL in seconds or None if permanent),
+            or None if missing or expired
+        """
+        now = time.time()
+        try:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache "
+                "WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (key, now),
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to read cache entry {key} from disk: {e}")
+            return None
+
+        if row is None:
+            return None
+        value, expires_at = row
+        return value, None if expires_at is None else expires_at - now
+
+    async def set(self, key: str, value: bytes, ttl: Optional[int]):
+        """
+        Store a value.
+
+        Args:
+            key: Entry key
+            value: Serialized value
+            ttl: TTL in seconds, or None for a permanent entry
+        """
+        await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._set, key, value, ttl
+        )
+
+    def _set(self, key: str, value: bytes, ttl: Optional[int]):
+        """
+        Store a value on the worker thread.
+
+        Args:
+            key: Entry key
+            value: Serialized value
+            ttl: TTL in seconds, or None for a permanent entry
+        """
+        expires_at = None if ttl is None else time.time() + ttl
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, expires_at),
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to write cache entry {key} to disk: {e}")
+
+    def delete(self, *keys: str):
+        """
+        Delete stored values, without waiting for the deletion to complete.
+
+        Args:
+            keys: Entry keys
+        """
+        self._executor.submit(self._delete, *keys)
+
+    def _delete(self, *keys: str):
+        """
+        Delete stored values on the worker thread.
+
+        Args:
+            keys: Entry keys
+        """
+        try:
+            self._conn.executemany("DELETE FROM cache WHERE key = ?", [(k,) for k in keys])
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to delete cache entries from disk: {e}")
+
+    def delete_prefix(self, prefix: str):
+        """
+        Delete all stored values whose key starts with prefix, without waiting.
+
+        Args:
+            prefix: Key prefix
+        """
+        self._executor.submit(self._delete_prefix, prefix)
+
+    def _delete_prefix(self, prefix: str):
+        """
+        Delete all stored values whose key starts with prefix on the worker thread.
+
+        Args:
+            prefix: Key prefix
+        """
+        try:
+            self._conn.execute(
+                "DELETE FROM cache WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to delete cache entries from disk: {e}")
+
+    def clear(self):
+        """Delete all stored values."""
+        self.delete_prefix("")
+
 
 class MetadataCache:
     """Cache manager for server metadata and tools."""
@@ -16,6 +177,9 @@ class MetadataCache:
         servers_ttl: int = 300,
         tools_ttl: int = 600,
         prompts_ttl: int = 0,  # 0 = never expire
+        persist_path: Optional[str] = None,
+        max_entries: int = 1000,
+        negative_ttl: int = 60,
     ):
         """
         Initialize cache manager.
@@ -24,15 +188,36 @@ class MetadataCache:
             servers_ttl: TTL for servers cache in seconds
             tools_ttl: TTL for tools cache in seconds
             prompts_ttl: TTL for prompts cache in seconds (0 = permanent)
+            persist_path: Path to SQLite file persisting the cache across restarts
+                (None = in-memory only)
+            max_entries: Maximum number of in-memory entries per cache kind;
+                least recently used entries are evicted first
+            negative_ttl: TTL in seconds for remembering that a server has no
+                metadata or prompt
         """
         self.servers_ttl = servers_ttl
         self.tools_ttl = tools_ttl
         self.prompts_ttl = prompts_ttl
-
-        self._servers_cache: Dict[str, CachedItem] = {}
-        self._tools_cache: Dict[str, CachedItem] = {}
-        self._prompts_cache: Dict[str, CachedItem] = {}
-        self._server_metadata_cache: Dict[str, CachedItem] = {}
+        self.max_entries = max_entries
+        self.negative_ttl = negative_ttl
+
+        # Disk-backed second level, consulted on in-memory misses
+        self._store: Optional[DiskStore] = None
+        if persist_path:
+            try:
+                self._store = DiskStore(persist_path)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Cache persistence disabled, cannot open {persist_path}: {e}")
+
+        # In-memory LRU caches, most recently used entries last
+        self._servers_cache: OrderedDict[str, CachedItem] = OrderedDict()
+        self._tools_cache: OrderedDict[str, CachedItem] = OrderedDict()
+        self._prompts_cache: OrderedDict[str, CachedItem] = OrderedDict()
+        self._server_metadata_cache: OrderedDict[str, CachedItem] = OrderedDict()
+        self._all_tools_cache: OrderedDict[str, CachedItem] = OrderedDict()
+
+        # In-flight fetches by (kind, key), shared by concurrent callers
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
 
     async def get_servers(self, catalog: str, fetch_func) -> list[ServerMetadata]:
         """
@@ -45,17 +230,9 @@ class MetadataCache:
         Returns:
             List of server metadata
         """
-        cache_key = f"catalog:{catalog}"
-        cached = self._servers_cache.get(cache_key)
-
-        if cached and not cached.is_expired():
-            logger.debug(f"Cache hit for servers: {cache_key}")
-            return cached.data
-
-        logger.debug(f"Cache miss for servers: {cache_key}, fetching...")
-        servers = await fetch_func()
-        self._servers_cache[cache_key] = CachedItem(data=servers, ttl=self.servers_ttl)
-        return servers
+        return await self._get_or_fetch(
+            "servers", self._servers_cache, f"catalog:{catalog}", self.servers_ttl, fetch_func
+        )
 
     async def get_server_metadata(self, server: str, fetch_func) -> Optional[ServerMetadata]:
         """
@@ -68,19 +245,14 @@ class MetadataCache:
         Returns:
             Server metadata or None
         """
-        cached = self._server_metadata_cache.get(server)
-
-        if cached and not cached.is_expired():
-            logger.debug(f"Cache hit for server metadata: {server}")
-            return cached.data
-
-        logger.debug(f"Cache miss for server metadata: {server}, fetching...")
-        metadata = await fetch_func()
-        if metadata:
-            self._server_metadata_cache[server] = CachedItem(
-                data=metadata, ttl=self.servers_ttl
-            )
-        return metadata
+        return await self._get_or_fetch(
+            "server metadata",
+            self._server_metadata_cache,
+            server,
+            self.servers_ttl,
+            fetch_func,
+            negative_ttl=self.negative_ttl,
+        )
 
     async def get_server_tools(self, server: str, fetch_func) -> list[Tool]:
         """
@@ -93,16 +265,23 @@ class MetadataCache:
         Returns:
             List of tools
         """
-        cached = self._tools_cache.get(server)
+        return await self._get_or_fetch(
+            "server tools", self._tools_cache, server, self.tools_ttl, fetch_func
+        )
 
-        if cached and not cached.is_expired():
-            logger.debug(f"Cache hit for server tools: {server}")
-            return cached.data
+    async def get_all_tools(self, fetch_func) -> Dict[str, list[Tool]]:
+        """
+        Get cached tools of all servers or fetch if expired.
 
-        logger.debug(f"Cache miss for server tools: {server}, fetching...")
-        tools = await fetch_func()
-        self._tools_cache[server] = CachedItem(data=tools, ttl=self.tools_ttl)
-        return tools
+        Args:
+            fetch_func: Async function to fetch tools grouped by server if cache expired
+
+        Returns:
+            Dictionary mapping server names to their tools
+        """
+        return await self._get_or_fetch(
+            "all tools", self._all_tools_cache, "all", self.tools_ttl, fetch_func
+        )
 
     async def get_server_prompt(self, server: str, fetch_func) -> Optional[str]:
         """
@@ -115,17 +294,210 @@ class MetadataCache:
         Returns:
             Prompt string or None
         """
-        cached = self._prompts_cache.get(server)
+        return await self._get_or_fetch(
+            "server prompt",
+            self._prompts_cache,
+            server,
+            self.prompts_ttl,
+            fetch_func,
+            negative_ttl=self.negative_ttl,
+            never_expire=self.prompts_ttl == 0,
+        )
+
+    async def get_server_info_serialized(
+        self, server: str, fetch_func
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the get_server_info response for a server, serialized once per cached metadata.
+
+        Args:
+            server: Server name
+            fetch_func: Async function to fetch metadata if cache expired
+
+        Returns:
+            Server information dictionary (shared, must not be modified),
+            or None if the server is not found
+        """
+        metadata = await self.get_server_metadata(server, fetch_func)
+        if not metadata:
+            return None
+        return self._serialized_view(
+            self._server_metadata_cache, server, metadata, _serialize_server_info
+        )
+
+    async def get_server_tools_serialized(self, server: str, fetch_func) -> Dict[str, Any]:
+        """
+        Get the get_server_tools response for a server, serialized once per cached tool list.
+
+        Args:
+            server: Server name
+            fetch_func: Async function to fetch tools if cache expired
+
+        Returns:
+            Server tools dictionary (shared, must not be modified)
+        """
+        tools = await self.get_server_tools(server, fetch_func)
+        return self._serialized_view(
+            self._tools_cache, server, tools, lambda tools: _serialize_server_tools(server, tools)
+        )
+
+    def _serialized_view(
+        self, cache: OrderedDict[str, CachedItem], key: str, data: Any, serialize
+    ) -> Any:
+        """
+        Get a serialized view of cached data, rebuilding it only when the data was refetched.
+
+        The view is kept on the cached item, so it is bounded by max_entries and
+        evicted or invalidated together with the value it was built from.
 
-        if cached and (self.prompts_ttl == 0 or not cached.is_expired()):
-            logger.debug(f"Cache hit for server prompt: {server}")
+        Args:
+            cache: Cache holding the value
+            key: Cache key of the value
+            data: Cached value the view is built from
+            serialize: Function building the view from the value
+
+        Returns:
+            Serialized view
+        """
+        item = cache.get(key)
+        # Cached values are replaced, never mutated, so identity tells whether the item is current
+        if item is None or item.data is not data:
+            return serialize(data)
+        if item.view is None:
+            item.view = serialize(data)
+        return item.view
+
+    async def _get_or_fetch(
+        self,
+        kind: str,
+        cache: OrderedDict[str, CachedItem],
+        key: str,
+        ttl: int,
+        fetch_func,
+        negative_ttl: Optional[int] = None,
+        never_expire: bool = False,
+    ) -> Any:
+        """
+        Get a cached value or fetch it, coalescing concurrent fetches for the same key.
+
+        Only one fetch per key is in flight at a time; concurrent callers on a cache
+        miss await the result of that fetch instead of starting their own.
+
+        Args:
+            kind: Cache kind (used for logging and in-flight bookkeeping)
+            cache: Cache dictionary to use
+            key: Cache key
+            ttl: TTL for the stored item in seconds
+            fetch_func: Async function to fetch the value on cache miss
+            negative_ttl: TTL for falsy values (None = same as ttl)
+            never_expire: Whether cached non-falsy items never expire
+
+        Returns:
+            Cached or freshly fetched value
+        """
+        cached = cache.get(key)
+        if cached and not cached.is_expired():
+            logger.debug(f"Cache hit for {kind}: {key}")
+            cache.move_to_end(key)
             return cached.data
 
-        logger.debug(f"Cache miss for server prompt: {server}, fetching...")
-        prompt = await fetch_func()
-        if prompt:
-            self._prompts_cache[server] = CachedItem(data=prompt, ttl=self.prompts_ttl)
-        return prompt
+        store_key = f"{kind}:{key}"
+        if self._store:
+            stored = await self._store.get(store_key)
+            if stored:
+                value, remaining = stored
+                try:
+                    data = _ADAPTERS[kind].validate_json(value)
+                except ValueError as e:
+                    # Written by an older model version or corrupted; refetch instead
+                    logger.warning(f"Discarding invalid disk cache entry {store_key}: {e}")
+                    self._store.delete(store_key)
+                else:
+                    item_ttl = math.inf if remaining is None else remaining
+                    self._put(cache, key, CachedItem.create(data, item_ttl))
+                    logger.debug(f"Disk cache hit for {kind}: {key}")
+                    return data
+
+        inflight_key = (kind, key)
+        inflight = self._inflight.get(inflight_key)
+        if inflight is None:
+            logger.debug(f"Cache miss for {kind}: {key}, fetching...")
+            # The fetch runs in its own task, so no single caller's cancellation stops it
+            inflight = asyncio.ensure_future(
+                self._fetch(kind, cache, key, ttl, fetch_func, negative_ttl, never_expire)
+            )
+            self._inflight[inflight_key] = inflight
+
+            def done(task: asyncio.Future):
+                if self._inflight.get(inflight_key) is task:
+                    del self._inflight[inflight_key]
+                if not task.cancelled():
+                    # Mark as retrieved: there may be no callers left to consume it
+                    task.exception()
+
+            inflight.add_done_callback(done)
+        else:
+            logger.debug(f"Awaiting in-flight fetch for {kind}: {key}")
+
+        return await asyncio.shield(inflight)
+
+    async def _fetch(
+        self,
+        kind: str,
+        cache: OrderedDict[str, CachedItem],
+        key: str,
+        ttl: int,
+        fetch_func,
+        negative_ttl: Optional[int],
+        never_expire: bool,
+    ) -> Any:
+        """
+        Fetch a value and store it in the cache.
+
+        Args:
+            kind: Cache kind
+            cache: Cache dictionary to use
+            key: Cache key
+            ttl: TTL for the stored item in seconds
+            fetch_func: Async function to fetch the value
+            negative_ttl: TTL for falsy values (None = same as ttl)
+            never_expire: Whether cached non-falsy items never expire
+
+        Returns:
+            Fetched value
+        """
+        data = await fetch_func()
+        if self._inflight.get((kind, key)) is not asyncio.current_task():
+            # Invalidated while fetching: the result may predate the change, so don't store it
+            logger.debug(f"Discarding fetch for {kind}: {key} invalidated in flight")
+            return data
+        if not data and negative_ttl is not None:
+            # Remember absence for a short time instead of re-fetching every lookup
+            item_ttl = negative_ttl
+        else:
+            item_ttl = math.inf if never_expire else ttl
+        self._put(cache, key, CachedItem.create(data, item_ttl))
+        if self._store:
+            await self._store.set(
+                f"{kind}:{key}",
+                _ADAPTERS[kind].dump_json(data),
+                None if item_ttl == math.inf else item_ttl,
+            )
+        return data
+
+    def _put(self, cache: OrderedDict[str, CachedItem], key: str, item: CachedItem):
+        """
+        Store an item as most recently used, evicting least recently used items.
+
+        Args:
+            cache: Cache dictionary to use
+            key: Cache key
+            item: Item to store
+        """
+        cache[key] = item
+        cache.move_to_end(key)
+        while len(cache) > self.max_entries:
+            cache.popitem(last=False)
 
     def invalidate_servers(self, catalog: Optional[str] = None):
         """
@@ -137,8 +509,31 @@ class MetadataCache:
         if catalog:
             cache_key = f"catalog:{catalog}"
             self._servers_cache.pop(cache_key, None)
+            self._drop_inflight("servers", cache_key)
+            if self._store:
+                self._store.delete(f"servers:{cache_key}")
         else:
             self._servers_cache.clear()
+            self._drop_inflight("servers")
+            if self._store:
+                self._store.delete_prefix("servers:")
+
+    def invalidate_tools(self, servers: List[str]):
+        """
+        Invalidate tool listings after servers were enabled or disabled.
+
+        Drops the snapshot of all tools and the tools cached for the given servers.
+
+        Args:
+            servers: Names of the servers whose state changed
+        """
+        self._all_tools_cache.clear()
+        self._drop_inflight("all tools")
+        for server in servers:
+            self._tools_cache.pop(server, None)
+            self._drop_inflight("server tools", server)
+        if self._store:
+            self._store.delete("all tools:all", *(f"server tools:{server}" for server in servers))
 
     def invalidate_server(self, server: str):
         """
@@ -150,6 +545,12 @@ class MetadataCache:
         self._server_metadata_cache.pop(server, None)
         self._tools_cache.pop(server, None)
         self._prompts_cache.pop(server, None)
+        for kind in ("server metadata", "server tools", "server prompt"):
+            self._drop_inflight(kind, server)
+        if self._store:
+            self._store.delete(
+                f"server metadata:{server}", f"server tools:{server}", f"server prompt:{server}"
+            )
 
     def clear(self):
         """Clear all caches."""
@@ -157,3 +558,72 @@ class MetadataCache:
         self._tools_cache.clear()
         self._prompts_cache.clear()
         self._server_metadata_cache.clear()
+        self._all_tools_cache.clear()
+        self._inflight.clear()
+        if self._store:
+            self._store.clear()
+
+    def _drop_inflight(self, kind: str, key: Optional[str] = None):
+        """
+        Forget in-flight fetches, so later lookups start a fresh one.
+
+        The dropped fetches still complete for the callers already awaiting them,
+        but their results are not stored.
+
+        Args:
+            kind: Cache kind
+            key: Cache key, or None for all keys of the kind
+        """
+        if key is not None:
+            self._inflight.pop((kind, key), None)
+            return
+        for inflight_key in [k for k in self._inflight if k[0] == kind]:
+            del self._inflight[inflight_key]
+
+
+def _serialize_server_info(metadata: ServerMetadata) -> Dict[str, Any]:
+    """
+    Build the get_server_info response.
+
+    Args:
+        metadata: Server metadata
+
+    Returns:
+        Server information dictionary
+    """
+    return {
+        "name": metadata.name,
+        "description": metadata.description,
+        "version": metadata.version,
+        "keywords": metadata.keywords,
+        "tools_count": metadata.tools_count,
+        "tools_preview": metadata.tools_preview,
+        "catalog_source": metadata.catalog_source,
+        "has_prompt": metadata.prompt is not None,
+        "config_requirements": metadata.config_requirements,
+    }
+
+
+def _serialize_server_tools(server: str, tools: list[Tool]) -> Dict[str, Any]:
+    """
+    Build the get_server_tools response.
+
+    Args:
+        server: Server name
+        tools: Server tools
+
+    Returns:
+        Server tools dictionary
+    """
+    return {
+        "server": server,
+        "tools_count": len(tools),
+        "tools": [
+            {
+                "name": tool.name,
+                "description": tool.description,
+                "inputSchema": tool.inputSchema,
+            }
+            for tool in tools
+        ],
+    }
@@ -1,14 +1,51 @@
-"""MCP Connection Pool for managing server state and CLI tool calls."""
+"""MCP Connection Pool for managing server state and tool calls."""
 
 import asyncio
+import builtins
 import logging
-from typing import Any, Dict, Optional
+import os
+import random
+import time
+from collections import defaultdict
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncIterator, DefaultDict, Dict, List, Optional
+
+import anyio
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED
 
 from .docker_client import DockerMCPClient
-from .exceptions import ConnectionError, ServerNotFoundError, ToolNotFoundError
+from .exceptions import ConnectionError, ServerNotFoundError
 
 logger = logging.getLogger(__name__)
 
+# Errors meaning the session itself is unusable, as opposed to a failed request
+_TRANSPORT_ERRORS = (
+    builtins.ConnectionError,
+    EOFError,
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    anyio.EndOfStream,
+)
+
+
+def _is_transport_error(error: BaseException) -> bool:
+    """
+    Check whether a failed request means the session itself is unusable.
+
+    Args:
+        error: Exception raised by the request
+
+    Returns:
+        True for transport failures, including requests the session failed
+        because its connection closed while they were pending
+    """
+    if isinstance(error, McpError):
+        return error.error.code == CONNECTION_CLOSED
+    return isinstance(error, _TRANSPORT_ERRORS)
+
 
 class ServerInfo:
     """Information about a server."""
@@ -26,8 +63,78 @@ class ServerInfo:
         self.last_checked: Optional[float] = None
 
 
+class ServerConnection:
+    """Persistent MCP session to a server, owned by a background task."""
+
+    def __init__(self, server: str):
+        """
+        Initialize server connection.
+
+        Args:
+            server: Server name
+        """
+        self.server = server
+        self.session: Optional[ClientSession] = None
+        # Usage tracking for idle eviction
+        self.last_used = time.monotonic()
+        self.in_use = 0
+        self._closing = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    async def open(self, params: StdioServerParameters, timeout: int) -> ClientSession:
+        """
+        Open and initialize the session.
+
+        The stdio transport and session are entered and exited by a dedicated task,
+        since their cancel scopes must be closed by the task that opened them.
+
+        Args:
+            params: Parameters of the stdio process to connect to
+            timeout: Initialization timeout in seconds
+
+        Returns:
+            Initialized client session
+        """
+        ready = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(self._run(params, timeout, ready))
+        try:
+            self.session = await ready
+        except BaseException:
+            self._task.cancel()
+            raise
+        return self.session
+
+    async def _run(self, params: StdioServerParameters, timeout: int, ready: asyncio.Future):
+        """Hold the session open until close() is called."""
+        try:
+            async with AsyncExitStack() as stack:
+                read, write = await stack.enter_async_context(stdio_client(params))
+                session = await stack.enter_async_context(ClientSession(read, write))
+                await asyncio.wait_for(session.initialize(), timeout=timeout)
+                ready.set_result(session)
+                await self._closing.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.warning(f"Connection to server {self.server} closed with error: {e}")
+        finally:
+            # Ended by cancellation or another BaseException before initializing:
+            # open() must not wait forever while holding the server's lock
+            if not ready.done():
+                ready.set_exception(
+                    ConnectionError(self.server, reason="Session ended before it was ready")
+                )
+
+    async def close(self):
+        """Close the session and its underlying process."""
+        self._closing.set()
+        if self._task:
+            await self._task
+
+
 class MCPConnectionPool:
-    """Pool for managing server state and CLI tool calls."""
+    """Pool of persistent MCP sessions and server state."""
 
     def __init__(
         self,
@@ -36,6 +143,9 @@ class MCPConnectionPool:
         reconnect_attempts: int = 3,
         reconnect_delay: int = 1,
         status_check_ttl: int = 30,
+        max_concurrent_reconnects: int = 3,
+        idle_timeout: int = 600,
+        health_check_interval: int = 30,
     ):
         """
         Initialize connection pool.
@@ -46,16 +156,30 @@ class MCPConnectionPool:
             reconnect_attempts: Number of reconnection attempts
             reconnect_delay: Delay between reconnection attempts in seconds
             status_check_ttl: TTL for server status cache in seconds
+            max_concurrent_reconnects: Maximum number of servers reconnecting at once
+            idle_timeout: Seconds a session may stay unused before it is closed (0 = never)
+            health_check_interval: Seconds between pings of idle sessions (0 = disabled)
         """
         self.docker_client = docker_client
         self.connection_timeout = connection_timeout
         self.reconnect_attempts = reconnect_attempts
         self.reconnect_delay = reconnect_delay
         self.status_check_ttl = status_check_ttl
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
 
         # Cache server status information
         self._server_info: Dict[str, ServerInfo] = {}
-        self._lock = asyncio.Lock()
+        # Caps reconnect storms against the Docker daemon
+        self._reconnect_semaphore = asyncio.Semaphore(max_concurrent_reconnects)
+
+        # Per-server locks, so slow operations on one server don't block others
+        self._locks: DefaultDict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+        # Persistent MCP sessions, each owning its gateway process and stdio pipes
+        self._connections: Dict[str, ServerConnection] = {}
+        # Background task evicting idle and dead sessions, started with the first session
+        self._maintenance_task: Optional[asyncio.Task] = None
 
     async def get_server_info(self, server: str) -> Optional[ServerInfo]:
         """
@@ -70,14 +194,15 @@ class MCPConnectionPool:
         Raises:
             ServerNotFoundError: If server is not found
         """
-        async with self._lock:
+        async with self._locks[server]:
             # Check cache first
             if server in self._server_info:
                 info = self._server_info[server]
                 # Check if cache is still valid
-                import time
-
-                if info.last_checked and (time.time() - info.last_checked) < self.status_check_ttl:
+                if (
+                    info.last_checked
+                    and (time.monotonic() - info.last_checked) < self.status_check_ttl
+                ):
                     return info
 
             # Check server status
@@ -90,10 +215,8 @@ class MCPConnectionPool:
                 raise ServerNotFoundError(server)
 
             # Update cache
-            import time
-
             info = ServerInfo(server, is_active=is_active)
-            info.last_checked = time.time()
+            info.last_checked = time.monotonic()
             self._server_info[server] = info
 
             return info
@@ -115,23 +238,27 @@ class MCPConnectionPool:
             logger.error(f"Error checking server status for {server}: {e}")
             return None
 
-    async def call_tool_via_cli(self, tool_name: str, arguments: Dict[str, Any], server: str) -> Any:
+    async def call_tool_batch(
+        self, tool_name: str, arguments_list: List[Dict[str, Any]], server: str
+    ) -> List[Any]:
         """
-        Call a tool through CLI.
+        Call a tool several times over a single acquisition of the server's session.
+
+        MCP has no bulk tool call, so the calls are issued concurrently on the
+        session. Calls that fail because the session broke are retried once on a
+        new session; other failures are returned as is, without reconnecting.
 
         Args:
             tool_name: Tool name
-            arguments: Tool arguments
-            server: Server name (for validation)
+            arguments_list: Arguments of each call
+            server: Server name
 
         Returns:
-            Tool result
+            Tool result as dictionary, or the raised exception, for each call in order
 
         Raises:
-            ConnectionError: If server is not active
-            ToolNotFoundError: If tool is not found
+            ConnectionError: If server is not active or connection fails
         """
-        # Check server status first
         server_info = await self.get_server_info(server)
         if not server_info or not server_info.is_active:
             raise ConnectionError(
@@ -139,21 +266,267 @@ class MCPConnectionPool:
                 reason="Server is not active. Use start_servers() to enable it.",
             )
 
-        # Call tool through CLI
+        async with self.acquire(server) as session:
+            call_tool = session.call_tool
+            results = await asyncio.gather(
+                *(call_tool(tool_name, arguments) for arguments in arguments_list),
+                return_exceptions=True,
+            )
+
+        failed = [i for i, result in enumerate(results) if _is_transport_error(result)]
+        if failed:
+            logger.warning(
+                f"{len(failed)} tool call(s) on server {server} failed, reconnecting: "
+                f"{results[failed[0]]!r}"
+            )
+            await self.replace(server, session)
+            async with self.acquire(server) as session:
+                call_tool = session.call_tool
+                retried = await asyncio.gather(
+                    *(call_tool(tool_name, arguments_list[i]) for i in failed),
+                    return_exceptions=True,
+                )
+            for i, result in zip(failed, retried):
+                results[i] = result
+
+        return [
+            result
+            if isinstance(result, BaseException)
+            else result.model_dump(mode="json", exclude_none=True)
+            for result in results
+        ]
+
+    @asynccontextmanager
+    async def acquire(self, server: str) -> AsyncIterator[ClientSession]:
+        """
+        Use the MCP session for a server, connecting on first use.
+
+        The session is shared: MCP multiplexes concurrent requests over it. While
+        acquired, it is not evicted for being idle.
+
+        Args:
+            server: Server name
+
+        Yields:
+            Initialized client session
+
+        Raises:
+            ConnectionError: If connection fails
+        """
+        connection = await self._get_or_create_connection(server)
+        connection.in_use += 1
         try:
-            result = await self.docker_client.call_tool(tool_name, arguments)
-            return result
-        except ToolNotFoundError:
-            raise
+            yield connection.session
+        finally:
+            connection.in_use -= 1
+            connection.last_used = time.monotonic()
+
+    async def get_connection(self, server: str) -> ClientSession:
+        """
+        Get the MCP session for a server, connecting on first use.
+
+        Args:
+            server: Server name
+
+        Returns:
+            Initialized client session
+
+        Raises:
+            ConnectionError: If connection fails
+        """
+        connection = await self._get_or_create_connection(server)
+        connection.last_used = time.monotonic()
+        return connection.session
+
+    async def _get_or_create_connection(self, server: str) -> ServerConnection:
+        """
+        Get the connection to a server, connecting on first use.
+
+        Args:
+            server: Server name
+
+        Returns:
+            Open server connection
+
+        Raises:
+            ConnectionError: If connection fails
+        """
+        async with self._locks[server]:
+            connection = self._connections.get(server)
+            if connection is None:
+                connection = await self._create_connection(server)
+            return connection
+
+    async def connect_many(self, servers: List[str]):
+        """
+        Connect to several servers concurrently.
+
+        Failures are logged; the affected servers are connected on first use instead.
+
+        Args:
+            servers: Server names
+        """
+        unique_servers = list(dict.fromkeys(servers))
+        results = await asyncio.gather(
+            *(self.get_connection(server) for server in unique_servers),
+            return_exceptions=True,
+        )
+
+        for server, result in zip(unique_servers, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to connect to server {server}: {result}")
+
+    async def _create_connection(self, server: str) -> ServerConnection:
+        """
+        Open and initialize an MCP session to a server via the Docker MCP gateway.
+
+        Args:
+            server: Server name
+
+        Returns:
+            Open server connection
+
+        Raises:
+            ConnectionError: If connection fails
+        """
+        cmd = self.docker_client.mcp_command("gateway", "run", "--servers", server)
+        # Pass the full environment, so DOCKER_HOST / DOCKER_CONTEXT / DOCKER_CONFIG apply
+        params = StdioServerParameters(command=cmd[0], args=cmd[1:], env=dict(os.environ))
+
+        connection = ServerConnection(server)
+        try:
+            await connection.open(params, self.connection_timeout)
         except Exception as e:
-            # Check if server became inactive
-            is_active = await self._check_server_status(server)
-            if not is_active:
-                raise ConnectionError(
-                    server,
-                    reason="Server became inactive during tool call",
-                ) from e
-            raise
+            raise ConnectionError(server, reason=str(e) or type(e).__name__) from e
+
+        self._connections[server] = connection
+        logger.info(f"Connected to server {server}")
+
+        if self._maintenance_task is None or self._maintenance_task.done():
+            self._maintenance_task = asyncio.create_task(self._maintain())
+        return connection
+
+    async def remove_connection(self, server: str):
+        """
+        Close and remove the MCP session for a server.
+
+        Args:
+            server: Server name
+        """
+        async with self._locks[server]:
+            connection = self._connections.pop(server, None)
+            if connection:
+                await self._close_connection(connection)
+
+    async def mark_broken(self, server: str, session: ClientSession):
+        """
+        Close the session of a server if it is still the current one.
+
+        Sessions already replaced by another caller are left alone, so concurrent
+        failures on the same session cause a single reconnect.
+
+        Args:
+            server: Server name
+            session: Session that failed
+        """
+        async with self._locks[server]:
+            connection = self._connections.get(server)
+            if connection is None or connection.session is not session:
+                return
+            del self._connections[server]
+            await self._close_connection(connection)
+
+    async def replace(self, server: str, session: ClientSession) -> ClientSession:
+        """
+        Replace a failed session of a server, retrying with exponential backoff.
+
+        Args:
+            server: Server name
+            session: Session that failed
+
+        Returns:
+            Current client session
+
+        Raises:
+            ConnectionError: If all reconnection attempts fail
+        """
+        await self.mark_broken(server, session)
+
+        last_error: Optional[ConnectionError] = None
+        async with self._reconnect_semaphore:
+            for attempt in range(self.reconnect_attempts):
+                try:
+                    return await self.get_connection(server)
+                except ConnectionError as e:
+                    last_error = e
+                    logger.warning(
+                        f"Reconnect to server {server} failed "
+                        f"(attempt {attempt + 1}/{self.reconnect_attempts}): {e}"
+                    )
+                    if attempt < self.reconnect_attempts - 1:
+                        # Exponential backoff with jitter to avoid lockstep retries
+                        await asyncio.sleep(
+                            self.reconnect_delay * (2 ** attempt) * random.uniform(0.5, 1.5)
+                        )
+
+        raise last_error or ConnectionError(server, reason="No reconnection attempts configured")
+
+    async def _maintain(self):
+        """Periodically close idle sessions and sessions that stopped answering pings."""
+        intervals = [t for t in (self.health_check_interval, self.idle_timeout) if t > 0]
+        if not intervals:
+            return
+
+        while self._connections:
+            await asyncio.sleep(min(intervals))
+            now = time.monotonic()
+            for server, connection in list(self._connections.items()):
+                if connection.in_use:
+                    continue
+                if self.idle_timeout > 0 and now - connection.last_used >= self.idle_timeout:
+                    logger.info(f"Closing idle connection to server {server}")
+                    await self.mark_broken(server, connection.session)
+                elif self.health_check_interval > 0:
+                    try:
+                        await asyncio.wait_for(
+                            connection.session.send_ping(), timeout=self.connection_timeout
+                        )
+                    except Exception as e:
+                        logger.warning(f"Health check of server {server} failed: {e!r}")
+                        await self.mark_broken(server, connection.session)
+
+    async def close_all(self):
+        """Close all MCP sessions."""
+        if self._maintenance_task:
+            self._maintenance_task.cancel()
+            try:
+                await self._maintenance_task
+            except asyncio.CancelledError:
+                pass
+            self._maintenance_task = None
+        connections = list(self._connections.values())
+        self._connections.clear()
+        results = await asyncio.gather(
+            *(self._close_connection(connection) for connection in connections),
+            return_exceptions=True,
+        )
+
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Error closing connection to server {connection.server}: {result}")
+
+    async def _close_connection(self, connection: ServerConnection):
+        """
+        Close a server connection, logging failures.
+
+        Args:
+            connection: Connection to close
+        """
+        try:
+            await connection.close()
+            logger.info(f"Disconnected from server {connection.server}")
+        except Exception as e:
+            logger.warning(f"Error closing connection to server {connection.server}: {e}")
 
     async def invalidate_server_cache(self, server: str):
         """
@@ -162,13 +535,12 @@ class MCPConnectionPool:
         Args:
             server: Server name
         """
-        async with self._lock:
+        async with self._locks[server]:
             self._server_info.pop(server, None)
 
     async def invalidate_all_cache(self):
         """Invalidate all server caches."""
-        async with self._lock:
-            self._server_info.clear()
+        self._server_info.clear()
 
     def is_server_active(self, server: str) -> bool:
         """
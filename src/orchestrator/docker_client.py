@@ -1,12 +1,16 @@
 """Docker MCP Toolkit client."""
 
-import json
+import asyncio
+import hashlib
 import logging
-from typing import Any, Dict, List, Optional
+import sys
+from typing import Any, AsyncIterator, Dict, List, Optional
 
-from .exceptions import CommandError, ParseError, ServerNotFoundError, ToolNotFoundError
-from .models import Server, ServerMetadata, Tool
-from .utils import parse_json_output, run_command
+import orjson
+
+from .exceptions import CommandError, DockerMCPError, ParseError
+from .models import ServerMetadata, Tool
+from .utils import parse_json_output, run_command, stream_json_items
 
 logger = logging.getLogger(__name__)
 
@@ -14,16 +18,41 @@ logger = logging.getLogger(__name__)
 class DockerMCPClient:
     """Client for interacting with Docker MCP Toolkit."""
 
-    def __init__(self, catalog: str = "docker-mcp", command_timeout: int = 30):
+    def __init__(
+        self,
+        catalog: str = "docker-mcp",
+        command_timeout: int = 30,
+        plugin_path: Optional[str] = None,
+    ):
         """
         Initialize Docker MCP Client.
 
         Args:
             catalog: Default catalog name
             command_timeout: Command timeout in seconds
+            plugin_path: Path to the docker-mcp CLI plugin binary. When set, the plugin
+                is executed directly instead of through the docker CLI front-end,
+                which skips docker CLI startup and plugin discovery on every call.
         """
         self.catalog = catalog
         self.command_timeout = command_timeout
+        self._base_cmd = [plugin_path] if plugin_path else ["docker", "mcp"]
+        # Hash of the last configuration read or written
+        self._last_config_hash: Optional[bytes] = None
+        # Read-only commands in flight, shared by concurrent identical calls
+        self._queries: Dict[tuple, asyncio.Future] = {}
+
+    def mcp_command(self, *args: str) -> List[str]:
+        """
+        Build a Docker MCP Toolkit command.
+
+        Args:
+            args: Subcommand and its arguments (e.g. "server", "ls")
+
+        Returns:
+            Full command line
+        """
+        return [*self._base_cmd, *args]
 
     async def get_catalog_servers(self, catalog: Optional[str] = None) -> List[ServerMetadata]:
         """
@@ -40,8 +69,8 @@ class DockerMCPClient:
             ParseError: If parsing fails
         """
         catalog_name = catalog or self.catalog
-        cmd = ["docker", "mcp", "catalog", "show", catalog_name, "--format=json"]
-        stdout, return_code = await run_command(cmd, timeout=self.command_timeout)
+        cmd = self.mcp_command("catalog", "show", catalog_name, "--format=json")
+        stdout, return_code = await self._run_query(cmd)
 
         if return_code != 0:
             error_msg = stdout if stdout else "Unknown error"
@@ -57,34 +86,35 @@ class DockerMCPClient:
             raise ParseError(
                 f"catalog show output for {catalog_name}",
                 reason="Empty or invalid JSON",
-                details={"stdout": stdout},
+                details={"stdout": stdout.decode("utf-8", "replace")},
             )
 
         servers = []
+        parse = self._parse_server_metadata
         # Parse catalog structure (structure may vary)
         try:
             if isinstance(data, dict):
                 if "servers" in data:
                     for server_name, server_data in data["servers"].items():
                         if isinstance(server_data, dict):
-                            servers.append(self._parse_server_metadata(server_name, server_data))
+                            servers.append(parse(server_name, server_data))
                 elif "items" in data:
                     # Alternative structure with items array
                     for item in data["items"]:
                         if isinstance(item, dict):
                             name = item.get("name", item.get("id", ""))
-                            servers.append(self._parse_server_metadata(name, item))
+                            servers.append(parse(name, item))
                 else:
                     # Try to parse as flat structure
                     for key, value in data.items():
                         if isinstance(value, dict):
-                            servers.append(self._parse_server_metadata(key, value))
+                            servers.append(parse(key, value))
             elif isinstance(data, list):
                 # Direct list of servers
                 for item in data:
                     if isinstance(item, dict):
                         name = item.get("name", item.get("id", ""))
-                        servers.append(self._parse_server_metadata(name, item))
+                        servers.append(parse(name, item))
         except Exception as e:
             raise ParseError(
                 f"catalog show output for {catalog_name}",
@@ -116,8 +146,8 @@ class DockerMCPClient:
             CommandError: If command fails
             ParseError: If parsing fails
         """
-        cmd = ["docker", "mcp", "server", "ls", "--json"]
-        stdout, return_code = await run_command(cmd, timeout=self.command_timeout)
+        cmd = self.mcp_command("server", "ls", "--json")
+        stdout, return_code = await self._run_query(cmd)
 
         if return_code != 0:
             error_msg = stdout if stdout else "Unknown error"
@@ -183,7 +213,7 @@ class DockerMCPClient:
         if not servers:
             return True
 
-        cmd = ["docker", "mcp", "server", "enable"] + servers
+        cmd = self.mcp_command("server", "enable", *servers)
         stdout, return_code = await run_command(cmd, timeout=self.command_timeout)
 
         if return_code != 0:
@@ -213,7 +243,7 @@ class DockerMCPClient:
         if not servers:
             return True
 
-        cmd = ["docker", "mcp", "server", "disable"] + servers
+        cmd = self.mcp_command("server", "disable", *servers)
         stdout, return_code = await run_command(cmd, timeout=self.command_timeout)
 
         if return_code != 0:
@@ -241,61 +271,61 @@ class DockerMCPClient:
             CommandError: If command fails
             ParseError: If parsing fails
         """
-        cmd = ["docker", "mcp", "tools", "ls", "--format=json"]
-        stdout, return_code = await run_command(cmd, timeout=self.command_timeout)
+        tools_by_server = await self.get_all_tools_by_server()
+        return tools_by_server.get(server, [])
 
-        if return_code != 0:
-            error_msg = stdout if stdout else "Unknown error"
-            raise CommandError(cmd, return_code, stderr=error_msg, details={"server": server})
+    async def get_all_tools_by_server(self) -> Dict[str, List[Tool]]:
+        """
+        Get tools of all servers with a single tools listing.
 
-        data = parse_json_output(stdout)
-        if not data:
-            # Empty list is valid - no tools
-            return []
+        Returns:
+            Dictionary mapping server names to their tools
 
-        tools = []
+        Raises:
+            CommandError: If command fails
+            ParseError: If parsing fails
+        """
+        cmd = self.mcp_command("tools", "ls", "--format=json")
+
+        tools_by_server: Dict[str, List[Tool]] = {}
+        async for tool_server, tool in self._iter_tools(cmd):
+            if tool_server:
+                tools_by_server.setdefault(tool_server, []).append(tool)
+
+        return tools_by_server
+
+    async def _iter_tools(self, cmd: List[str]) -> AsyncIterator[tuple[Optional[str], Tool]]:
+        """
+        Run a tools listing command and yield tools as they are parsed.
+
+        Args:
+            cmd: Tools listing command
+
+        Yields:
+            Tuples of (server name if present, tool)
+
+        Raises:
+            CommandError: If command fails
+            ParseError: If parsing fails
+        """
         try:
-            # Filter tools by server
-            if isinstance(data, list):
-                for tool_data in data:
-                    if isinstance(tool_data, dict):
-                        # Try different possible keys for server name
-                        tool_server = (
-                            tool_data.get("server")
-                            or tool_data.get("serverName")
-                            or tool_data.get("server_name")
-                        )
-                        if tool_server == server:
-                            tools.append(self._parse_tool(tool_data))
-            elif isinstance(data, dict):
-                if "tools" in data:
-                    for tool_data in data["tools"]:
-                        if isinstance(tool_data, dict):
-                            tool_server = (
-                                tool_data.get("server")
-                                or tool_data.get("serverName")
-                                or tool_data.get("server_name")
-                            )
-                            if tool_server == server:
-                                tools.append(self._parse_tool(tool_data))
-                elif "items" in data:
-                    for tool_data in data["items"]:
-                        if isinstance(tool_data, dict):
-                            tool_server = (
-                                tool_data.get("server")
-                                or tool_data.get("serverName")
-                                or tool_data.get("server_name")
-                            )
-                            if tool_server == server:
-                                tools.append(self._parse_tool(tool_data))
+            # Tools arrive either as a top-level array or under "tools"/"items"
+            async for tool_data in stream_json_items(
+                cmd, ("item", "tools.item", "items.item"), timeout=self.command_timeout
+            ):
+                # Try different possible keys for server name
+                tool_server = (
+                    tool_data.get("server")
+                    or tool_data.get("serverName")
+                    or tool_data.get("server_name")
+                )
+                if isinstance(tool_server, str):
+                    tool_server = sys.intern(tool_server)
+                yield tool_server, self._parse_tool(tool_data)
+        except DockerMCPError:
+            raise
         except Exception as e:
-            raise ParseError(
-                "tools ls output",
-                reason=str(e),
-                details={"server": server, "data": data},
-            ) from e
-
-        return tools
+            raise ParseError("tools ls output", reason=str(e)) from e
 
     async def get_server_info(self, server: str) -> Optional[ServerMetadata]:
         """
@@ -312,8 +342,8 @@ class DockerMCPClient:
             ParseError: If parsing fails
         """
         # Try inspect command first
-        cmd = ["docker", "mcp", "server", "inspect", server]
-        stdout, return_code = await run_command(cmd, timeout=self.command_timeout)
+        cmd = self.mcp_command("server", "inspect", server)
+        stdout, return_code = await self._run_query(cmd)
 
         if return_code == 0:
             data = parse_json_output(stdout)
@@ -350,8 +380,8 @@ class DockerMCPClient:
             CommandError: If command fails
             ParseError: If parsing fails
         """
-        cmd = ["docker", "mcp", "config", "read"]
-        stdout, return_code = await run_command(cmd, timeout=self.command_timeout)
+        cmd = self.mcp_command("config", "read")
+        stdout, return_code = await self._run_query(cmd)
 
         if return_code != 0:
             error_msg = stdout if stdout else "Unknown error"
@@ -359,9 +389,15 @@ class DockerMCPClient:
 
         data = parse_json_output(stdout)
         if data is None:
-            raise ParseError("config read output", reason="Empty or invalid JSON", details={"stdout": stdout})
+            raise ParseError(
+                "config read output",
+                reason="Empty or invalid JSON",
+                details={"stdout": stdout.decode("utf-8", "replace")},
+            )
 
-        return data if data else {}
+        config = data if data else {}
+        self._last_config_hash = self._config_hash(self._encode_config(config))
+        return config
 
     async def config_write(self, config: Dict[str, Any]) -> bool:
         """
@@ -376,11 +412,17 @@ class DockerMCPClient:
         Raises:
             CommandError: If command fails
         """
-        import asyncio
+        # Encoded once: the same bytes are hashed and written to stdin
+        config_bytes = self._encode_config(config)
+        config_hash = self._config_hash(config_bytes)
+        if config_hash == self._last_config_hash:
+            logger.debug("Configuration unchanged, skipping write")
+            return True
 
         # Docker MCP config write expects input from stdin
-        config_json = json.dumps(config)
-        cmd = ["docker", "mcp", "config", "write"]
+        cmd = self.mcp_command("config", "write")
+        # Stored config is unknown until this write succeeds
+        self._last_config_hash = None
         try:
             process = await asyncio.create_subprocess_exec(
                 *cmd,
@@ -389,10 +431,11 @@ class DockerMCPClient:
                 stderr=asyncio.subprocess.PIPE,
             )
             stdout, stderr = await asyncio.wait_for(
-                process.communicate(input=config_json.encode()), timeout=self.command_timeout
+                process.communicate(input=config_bytes), timeout=self.command_timeout
             )
 
             if process.returncode == 0:
+                self._last_config_hash = config_hash
                 return True
             else:
                 error_msg = stderr.decode() if stderr else stdout.decode() if stdout else "Unknown error"
@@ -431,7 +474,7 @@ class DockerMCPClient:
         Raises:
             CommandError: If command fails
         """
-        cmd = ["docker", "mcp", "secret", "set", f"{key}={value}"]
+        cmd = self.mcp_command("secret", "set", f"{key}={value}")
         stdout, return_code = await run_command(cmd, timeout=self.command_timeout)
 
         if return_code != 0:
@@ -451,8 +494,8 @@ class DockerMCPClient:
             CommandError: If command fails
             ParseError: If parsing fails
         """
-        cmd = ["docker", "mcp", "secret", "ls", "--json"]
-        stdout, return_code = await run_command(cmd, timeout=self.command_timeout)
+        cmd = self.mcp_command("secret", "ls", "--json")
+        stdout, return_code = await self._run_query(cmd)
 
         if return_code != 0:
             error_msg = stdout if stdout else "Unknown error"
@@ -493,7 +536,7 @@ class DockerMCPClient:
         Raises:
             CommandError: If command fails
         """
-        cmd = ["docker", "mcp", "secret", "rm", key]
+        cmd = self.mcp_command("secret", "rm", key)
         stdout, return_code = await run_command(cmd, timeout=self.command_timeout)
 
         if return_code != 0:
@@ -502,101 +545,48 @@ class DockerMCPClient:
 
         return True
 
-    async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    async def _run_query(self, cmd: List[str]) -> tuple[bytes | str, int]:
         """
-        Call a tool through Docker MCP Toolkit CLI.
+        Run a read-only command, sharing one process among concurrent identical calls.
 
         Args:
-            tool_name: Name of the tool to call
-            arguments: Tool arguments as dictionary
+            cmd: Command to run
 
         Returns:
-            Tool result as dictionary
-
-        Raises:
-            CommandError: If command fails
-            ParseError: If parsing fails
-            ToolNotFoundError: If tool is not found
+            Tuple of (output, return_code) as returned by run_command
         """
-        # Prepare arguments as JSON string
-        arguments_json = json.dumps(arguments)
-
-        # Build command: docker mcp tools call <tool_name> --arguments <json>
-        cmd = ["docker", "mcp", "tools", "call", tool_name, "--arguments", arguments_json]
-
-        stdout, return_code = await run_command(cmd, timeout=self.command_timeout)
-
-        if return_code != 0:
-            error_msg = stdout if stdout else "Unknown error"
-            # Check if tool not found
-            if "not found" in error_msg.lower() or "unknown tool" in error_msg.lower():
-                raise ToolNotFoundError(
-                    tool_name,
-                    details={"command": cmd, "stderr": error_msg},
-                )
-            raise CommandError(
-                cmd,
-                return_code,
-                stderr=error_msg,
-                details={"tool_name": tool_name, "arguments": arguments},
-            )
+        key = tuple(cmd)
+        query = self._queries.get(key)
+        if query is None:
+            query = asyncio.ensure_future(run_command(cmd, timeout=self.command_timeout))
+            self._queries[key] = query
+            query.add_done_callback(lambda _: self._queries.pop(key, None))
+        else:
+            logger.debug(f"Joining in-flight command: {' '.join(cmd)}")
+        # Shield so a cancelled caller doesn't kill the process other callers await
+        return await asyncio.shield(query)
 
-        # Parse JSON response
-        data = parse_json_output(stdout)
-        if data is None:
-            # Try to parse as plain text if JSON parsing fails
-            if stdout.strip():
-                # Return as text result
-                return {"result": stdout.strip(), "type": "text"}
-            raise ParseError(
-                f"tools call output for {tool_name}",
-                reason="Empty or invalid JSON",
-                details={"stdout": stdout},
-            )
+    @staticmethod
+    def _encode_config(config: Dict[str, Any]) -> bytes:
+        """Encode a configuration as JSON with sorted keys."""
+        return orjson.dumps(config, option=orjson.OPT_SORT_KEYS)
 
-        # Handle different response formats
-        if isinstance(data, dict):
-            # Check for error in response
-            if "error" in data:
-                error_msg = data.get("error", "Unknown error")
-                if "not found" in str(error_msg).lower():
-                    raise ToolNotFoundError(
-                        tool_name,
-                        details={"response": data},
-                    )
-                raise CommandError(
-                    cmd,
-                    -1,
-                    stderr=str(error_msg),
-                    details={"tool_name": tool_name, "response": data},
-                )
-            # Return result
-            return data
-        elif isinstance(data, list):
-            # List of results
-            return {"results": data, "type": "list"}
-        else:
-            # Primitive value
-            return {"result": data, "type": "primitive"}
+    @staticmethod
+    def _config_hash(config_bytes: bytes) -> bytes:
+        """Hash an encoded configuration."""
+        return hashlib.blake2b(config_bytes, digest_size=16).digest()
 
     def _parse_server_metadata(self, name: str, data: Dict[str, Any]) -> ServerMetadata:
         """Parse server metadata from catalog data."""
-        return ServerMetadata(
-            name=name,
-            description=data.get("description"),
-            version=data.get("version"),
-            keywords=data.get("keywords", []),
-            tools_count=data.get("tools_count", 0),
-            tools_preview=data.get("tools_preview", []),
-            catalog_source=data.get("catalog_source"),
-            prompt=data.get("prompt"),
-            config_requirements=data.get("config_requirements", {}),
-        )
+        # Validate the whole dict in one call: unknown keys are ignored and
+        # missing ones take the model defaults. Names are interned, since the
+        # same few are held by every cache, index and view.
+        return ServerMetadata.model_validate({**data, "name": sys.intern(name)})
 
     def _parse_tool(self, data: Dict[str, Any]) -> Tool:
         """Parse tool from data."""
         return Tool(
-            name=data.get("name", ""),
+            name=sys.intern(data.get("name", "")),
             description=data.get("description"),
             inputSchema=data.get("inputSchema"),
         )
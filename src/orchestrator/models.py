@@ -1,10 +1,12 @@
 """Data models for Orchestrator."""
 
+import time
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ServerStatus(str, Enum):
@@ -19,6 +21,9 @@ class ServerStatus(str, Enum):
 class Tool(BaseModel):
     """MCP Tool model."""
 
+    # Instances are shared through the metadata cache
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Tool name")
     description: Optional[str] = Field(None, description="Tool description")
     inputSchema: Optional[Dict[str, Any]] = Field(None, description="Tool input schema")
@@ -41,6 +46,9 @@ class ServerConfig(BaseModel):
 class ServerMetadata(BaseModel):
     """Server metadata model."""
 
+    # Instances are shared through the metadata cache
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Server name")
     description: Optional[str] = Field(None, description="Server description")
     version: Optional[str] = Field(None, description="Server version")
@@ -65,17 +73,32 @@ class Server(BaseModel):
     error: Optional[str] = Field(None, description="Error message if status is ERROR")
 
 
-class CachedItem(BaseModel):
-    """Cached item model."""
+@dataclass(slots=True)
+class CachedItem:
+    """Cached item with a monotonic-clock expiry time."""
+
+    data: Any
+    expires_at: float
+    # Serialized response built from data, dropped together with the item
+    view: Any = None
+
+    @classmethod
+    def create(cls, data: Any, ttl: float = 300) -> "CachedItem":
+        """
+        Create a cached item expiring after ttl seconds.
+
+        Args:
+            data: Cached data
+            ttl: Time to live in seconds (math.inf = never expires)
 
-    data: Any = Field(..., description="Cached data")
-    timestamp: datetime = Field(default_factory=datetime.now, description="Cache timestamp")
-    ttl: int = Field(300, description="Time to live in seconds")
+        Returns:
+            CachedItem instance
+        """
+        return cls(data, time.monotonic() + ttl)
 
     def is_expired(self) -> bool:
         """Check if cache item is expired."""
-        age = (datetime.now() - self.timestamp).total_seconds()
-        return age > self.ttl
+        return time.monotonic() >= self.expires_at
 
 
 class StartServersResult(BaseModel):
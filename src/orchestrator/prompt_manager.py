@@ -1,5 +1,6 @@
 """Prompt manager for MCP servers."""
 
+import asyncio
 import logging
 from typing import Dict, List, Optional
 
@@ -52,10 +53,17 @@ class PromptManager:
         Returns:
             Dictionary mapping server names to their prompts
         """
+        # Fetch concurrently: cache misses overlap instead of running one by one
+        results = await asyncio.gather(
+            *(self.get_server_prompt(server) for server in servers),
+            return_exceptions=True,
+        )
+
         prompts = {}
-        for server in servers:
-            prompt = await self.get_server_prompt(server)
-            if prompt:
+        for server, prompt in zip(servers, results):
+            if isinstance(prompt, Exception):
+                logger.warning(f"Failed to get prompt for server {server}: {prompt}")
+            elif prompt:
                 prompts[server] = prompt
                 logger.debug(f"Found prompt for server {server}")
             else:
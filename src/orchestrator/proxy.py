@@ -1,27 +1,87 @@
 """Proxy layer for routing tool calls to MCP servers."""
 
+import itertools
 import logging
-from typing import Any, Dict, List, Optional
+import sys
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from .exceptions import ConnectionError, ToolNotFoundError
+from .batcher import AsyncBatcher
+from .exceptions import ConnectionError
 from .models import Tool
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class ServerToolTable:
+    """Tools of a server, with their fields stored as parallel columns."""
+
+    names: List[str]
+    descriptions: List[Optional[str]]
+    schemas: List[Optional[Dict[str, Any]]]
+    tools: List[Tool]
+
+    @classmethod
+    def from_tools(cls, tools: List[Tool]) -> "ServerToolTable":
+        """
+        Build a table from tool models.
+
+        Args:
+            tools: Tools provided by the server
+
+        Returns:
+            Tool table
+        """
+        return cls(
+            names=[sys.intern(tool.name) for tool in tools],
+            descriptions=[tool.description for tool in tools],
+            schemas=[tool.inputSchema for tool in tools],
+            tools=tools,
+        )
+
+    def iter_serialized(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the tools serialized as dictionaries.
+
+        Yields:
+            Dictionary with tool name, description and input schema
+        """
+        for name, description, schema in zip(self.names, self.descriptions, self.schemas):
+            yield {"name": name, "description": description, "inputSchema": schema}
+
+
 class ToolProxy:
     """Proxy for routing tool calls to appropriate MCP servers."""
 
-    def __init__(self, connection_pool):
+    def __init__(
+        self,
+        connection_pool,
+        batch_max_size: int = 32,
+        batch_queue_size: int = 128,
+        batch_max_wait_ms: int = 10,
+    ):
         """
         Initialize tool proxy.
 
         Args:
             connection_pool: MCPConnectionPool instance
+            batch_max_size: Maximum number of concurrent calls of a tool sent together
+            batch_queue_size: Maximum number of pending calls per tool
+            batch_max_wait_ms: Time to wait for concurrent calls to join a batch
         """
         self._pool = connection_pool
+        self.batch_max_size = batch_max_size
+        self.batch_queue_size = batch_queue_size
+        self.batch_max_wait_ms = batch_max_wait_ms
         self._tool_to_server: Dict[str, str] = {}
-        self._server_tools: Dict[str, List[Tool]] = {}
+        self._server_tools: Dict[str, ServerToolTable] = {}
+
+        # Serialized view of registered tools, rebuilt lazily after registration changes
+        self._serialized_cache: Optional[Dict[str, Any]] = None
+
+        # Call batchers by (server, tool name), created on first call
+        self._batchers: Dict[Tuple[str, str], AsyncBatcher] = {}
 
     def register_tools(self, server: str, tools: List[Tool]):
         """
@@ -31,27 +91,43 @@ class ToolProxy:
             server: Server name
             tools: List of tools provided by the server
         """
-        self._server_tools[server] = tools
-        for tool in tools:
-            self._tool_to_server[tool.name] = server
+        server = sys.intern(server)
+        table = ServerToolTable.from_tools(tools)
+        self._server_tools[server] = table
+        self._tool_to_server.update(dict.fromkeys(table.names, server))
+        self._invalidate_views()
         logger.info(f"Registered {len(tools)} tools for server {server}")
 
-    def unregister_server(self, server: str):
+    async def unregister_server(self, server: str):
         """
-        Unregister all tools for a server.
+        Unregister all tools for a server and close its connection.
 
         Args:
             server: Server name
         """
         if server in self._server_tools:
-            tools = self._server_tools[server]
-            for tool in tools:
-                self._tool_to_server.pop(tool.name, None)
+            for name in self._server_tools[server].names:
+                # Keep names since re-registered by another server
+                if self._tool_to_server.get(name) == server:
+                    del self._tool_to_server[name]
             self._server_tools.pop(server, None)
-            # Invalidate server cache
-            self._pool.invalidate_server_cache(server)
+            self._invalidate_views()
+            for key in [key for key in self._batchers if key[0] == server]:
+                del self._batchers[key]
+            # Drop the persistent session and invalidate server cache
+            await self._pool.remove_connection(server)
+            await self._pool.invalidate_server_cache(server)
             logger.info(f"Unregistered server {server}")
 
+    async def connect_servers(self, servers: List[str]):
+        """
+        Open connections to servers ahead of their first tool call.
+
+        Args:
+            servers: Server names
+        """
+        await self._pool.connect_many(servers)
+
     def get_server_for_tool(self, tool_name: str) -> Optional[str]:
         """
         Get server that provides a specific tool.
@@ -84,13 +160,9 @@ class ToolProxy:
             return None, error
 
         try:
-            # Call tool through CLI via connection pool
-            result = await self._pool.call_tool_via_cli(tool_name, arguments, server)
+            # Concurrent calls of the same tool share one session acquisition
+            result = await self._get_batcher(server, tool_name).run(arguments)
             return result, None
-        except ToolNotFoundError as e:
-            error = str(e)
-            logger.error(error)
-            return None, error
         except ConnectionError as e:
             error = str(e)
             logger.error(error)
@@ -102,6 +174,33 @@ class ToolProxy:
             logger.error(error, exc_info=True)
             return None, error
 
+    def _get_batcher(self, server: str, tool_name: str) -> AsyncBatcher:
+        """
+        Get the call batcher for a tool, creating it on first use.
+
+        Args:
+            server: Server name
+            tool_name: Tool name
+
+        Returns:
+            Batcher dispatching calls of the tool to the server
+        """
+        key = (server, tool_name)
+        batcher = self._batchers.get(key)
+        if batcher is None:
+
+            async def process_batch(batch: List[Dict[str, Any]]) -> List[Any]:
+                return await self._pool.call_tool_batch(tool_name, batch, server)
+
+            batcher = AsyncBatcher(
+                process_batch,
+                max_batch=self.batch_max_size,
+                queue_size=self.batch_queue_size,
+                max_wait_ms=self.batch_max_wait_ms,
+            )
+            self._batchers[key] = batcher
+        return batcher
+
     def list_active_tools(self) -> List[Tool]:
         """
         List all active tools from all registered servers.
@@ -109,10 +208,42 @@ class ToolProxy:
         Returns:
             List of all active tools
         """
-        all_tools = []
-        for tools in self._server_tools.values():
-            all_tools.extend(tools)
-        return all_tools
+        return list(
+            itertools.chain.from_iterable(table.tools for table in self._server_tools.values())
+        )
+
+    def build_active_tools_view(self) -> Dict[str, Any]:
+        """
+        Get active tools serialized for the list_active_tools response.
+
+        Both groupings are filled in a single pass over the registered servers;
+        the result is kept until registrations change.
+
+        Returns:
+            Dictionary with active tools grouped by server (shared, must not be modified)
+        """
+        if self._serialized_cache is None:
+            tools_by_server: Dict[str, List[Dict[str, Any]]] = {}
+            all_tools: List[Dict[str, Any]] = []
+            for server, table in self._server_tools.items():
+                server_tools = tools_by_server[server] = []
+                for tool in table.iter_serialized():
+                    server_tools.append(tool)
+                    all_tools.append(
+                        {"name": tool["name"], "description": tool["description"], "server": server}
+                    )
+
+            self._serialized_cache = {
+                "total_tools": len(all_tools),
+                "servers": list(tools_by_server),
+                "tools_by_server": tools_by_server,
+                "all_tools": all_tools,
+            }
+        return self._serialized_cache
+
+    def _invalidate_views(self):
+        """Drop cached tool views after registration changes."""
+        self._serialized_cache = None
 
     def get_server_tools(self, server: str) -> List[Tool]:
         """
@@ -124,7 +255,21 @@ class ToolProxy:
         Returns:
             List of tools
         """
-        return self._server_tools.get(server, [])
+        table = self._server_tools.get(server)
+        return table.tools if table else []
+
+    def get_server_tool_names(self, server: str) -> List[str]:
+        """
+        Get names of the tools of a specific server.
+
+        Args:
+            server: Server name
+
+        Returns:
+            List of tool names (shared, must not be modified)
+        """
+        table = self._server_tools.get(server)
+        return table.names if table else []
 
     def list_servers(self) -> List[str]:
         """
@@ -1,9 +1,11 @@
 """Main MCP Server for Orchestrator."""
 
 import asyncio
+import functools
 import json
 import logging
-from typing import Any, Dict
+import os
+from typing import Any, Dict, Optional
 
 import yaml
 from mcp.server import Server
@@ -17,51 +19,74 @@ from .prompt_manager import PromptManager
 from .proxy import ToolProxy
 
 # Import all tools
-from .tools.config.config_get import get_tool as config_get_tool, handle_tool as handle_config_get
-from .tools.config.config_set import get_tool as config_set_tool, handle_tool as handle_config_set
-from .tools.config.secret_list import get_tool as secret_list_tool, handle_tool as handle_secret_list
-from .tools.config.secret_remove import (
-    get_tool as secret_remove_tool,
-    handle_tool as handle_secret_remove,
-)
-from .tools.config.secret_set import get_tool as secret_set_tool, handle_tool as handle_secret_set
-from .tools.info.get_info import get_tool as get_info_tool, handle_tool as handle_get_info
-from .tools.info.get_tools import get_tool as get_tools_tool, handle_tool as handle_get_tools
-from .tools.proxy.call_tool import get_tool as call_tool_tool, handle_tool as handle_call_tool
-from .tools.proxy.list_active_tools import (
-    get_tool as list_active_tools_tool,
-    handle_tool as handle_list_active_tools,
-)
-from .tools.servers.get_active import (
-    get_tool as get_active_tool,
-    handle_tool as handle_get_active,
-)
-from .tools.servers.list_catalog import (
-    get_tool as list_catalog_tool,
-    handle_tool as handle_list_catalog,
-)
-from .tools.servers.list_installed import (
-    get_tool as list_installed_tool,
-    handle_tool as handle_list_installed,
-)
-from .tools.servers.start import get_tool as start_tool, handle_tool as handle_start
-from .tools.servers.stop import get_tool as stop_tool, handle_tool as handle_stop
+from .tools import get_all_static_tools
+from .tools.config.config_get import handle_tool as handle_config_get
+from .tools.config.config_set import handle_tool as handle_config_set
+from .tools.config.secret_list import handle_tool as handle_secret_list
+from .tools.config.secret_remove import handle_tool as handle_secret_remove
+from .tools.config.secret_set import handle_tool as handle_secret_set
+from .tools.info.get_info import handle_tool as handle_get_info
+from .tools.info.get_tools import handle_tool as handle_get_tools
+from .tools.proxy.call_tool import handle_tool as handle_call_tool
+from .tools.proxy.list_active_tools import handle_tool as handle_list_active_tools
+from .tools.servers.get_active import handle_tool as handle_get_active
+from .tools.servers.list_catalog import handle_tool as handle_list_catalog
+from .tools.servers.list_installed import handle_tool as handle_list_installed
+from .tools.servers.start import handle_tool as handle_start
+from .tools.servers.stop import handle_tool as handle_stop
 
 logger = logging.getLogger(__name__)
 
+# libyaml-backed loader when available, several times faster than the pure-Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_config(config_path: str) -> Dict[str, Any]:
+    """
+    Load configuration from YAML file.
+
+    The parsed result is cached per file modification time, so repeated loads
+    of an unchanged file don't parse it again.
+
+    Args:
+        config_path: Path to configuration file
+
+    Returns:
+        Configuration dictionary (empty if the file is missing or invalid)
+    """
+    try:
+        mtime_ns = os.stat(config_path).st_mtime_ns
+        return _parse_config(config_path, mtime_ns)
+    except FileNotFoundError:
+        logger.warning(f"Config file {config_path} not found, using defaults")
+        return {}
+    except Exception as e:
+        logger.error(f"Error loading config: {e}")
+        return {}
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_config(config_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a configuration file version identified by its modification time."""
+    with open(config_path, "r") as f:
+        return yaml.load(f, Loader=_YAML_LOADER) or {}
+
 
 class OrchestratorServer:
     """Main Orchestrator MCP Server."""
 
-    def __init__(self, config_path: str = "config/config.yaml"):
+    def __init__(
+        self, config_path: str = "config/config.yaml", config: Optional[Dict[str, Any]] = None
+    ):
         """
         Initialize Orchestrator Server.
 
         Args:
             config_path: Path to configuration file
+            config: Already loaded configuration (config_path is not read if given)
         """
         # Load configuration
-        self.config = self._load_config(config_path)
+        self.config = config if config is not None else load_config(config_path)
 
         # Initialize components
         cache_config = self.config.get("orchestrator", {}).get("cache", {})
@@ -69,12 +94,16 @@ class OrchestratorServer:
             servers_ttl=cache_config.get("servers_ttl", 300),
             tools_ttl=cache_config.get("tools_ttl", 600),
             prompts_ttl=cache_config.get("prompts_ttl", 0),
+            persist_path=cache_config.get("persist_path"),
+            max_entries=cache_config.get("max_entries", 1000),
+            negative_ttl=cache_config.get("negative_ttl", 60),
         )
 
         docker_config = self.config.get("orchestrator", {}).get("docker_mcp", {})
         self.docker_client = DockerMCPClient(
             catalog=docker_config.get("catalog", "docker-mcp"),
             command_timeout=docker_config.get("command_timeout", 30),
+            plugin_path=docker_config.get("plugin_path"),
         )
 
         proxy_config = self.config.get("orchestrator", {}).get("proxy", {})
@@ -84,9 +113,17 @@ class OrchestratorServer:
             reconnect_attempts=proxy_config.get("reconnect_attempts", 3),
             reconnect_delay=proxy_config.get("reconnect_delay", 1),
             status_check_ttl=proxy_config.get("status_check_ttl", 30),
+            max_concurrent_reconnects=proxy_config.get("max_concurrent_reconnects", 3),
+            idle_timeout=proxy_config.get("idle_timeout", 600),
+            health_check_interval=proxy_config.get("health_check_interval", 30),
         )
 
-        self.proxy = ToolProxy(self.connection_pool)
+        self.proxy = ToolProxy(
+            self.connection_pool,
+            batch_max_size=proxy_config.get("batch_max_size", 32),
+            batch_queue_size=proxy_config.get("batch_queue_size", 128),
+            batch_max_wait_ms=proxy_config.get("batch_max_wait_ms", 10),
+        )
         self.prompt_manager = PromptManager(self.cache, self.docker_client)
 
         # Initialize MCP Server
@@ -98,18 +135,6 @@ class OrchestratorServer:
         # Register handlers
         self._register_handlers()
 
-    def _load_config(self, config_path: str) -> Dict[str, Any]:
-        """Load configuration from YAML file."""
-        try:
-            with open(config_path, "r") as f:
-                return yaml.safe_load(f) or {}
-        except FileNotFoundError:
-            logger.warning(f"Config file {config_path} not found, using defaults")
-            return {}
-        except Exception as e:
-            logger.error(f"Error loading config: {e}")
-            return {}
-
     def _register_tools(self):
         """Register all tools with MCP server."""
         # Tools will be registered via handlers
@@ -121,26 +146,7 @@ class OrchestratorServer:
         @self.server.list_tools()
         async def list_tools() -> list[Tool]:
             """List all available tools."""
-            return [
-                # Server management
-                list_installed_tool(),
-                list_catalog_tool(),
-                start_tool(),
-                stop_tool(),
-                get_active_tool(),
-                # Information
-                get_tools_tool(),
-                get_info_tool(),
-                # Configuration
-                config_set_tool(),
-                config_get_tool(),
-                secret_set_tool(),
-                secret_list_tool(),
-                secret_remove_tool(),
-                # Proxy
-                call_tool_tool(),
-                list_active_tools_tool(),
-            ]
+            return list(get_all_static_tools())
 
         @self.server.call_tool()
         async def handle_tool_call(name: str, arguments: Dict[str, Any]) -> list[dict[str, Any]]:
@@ -164,7 +170,9 @@ class OrchestratorServer:
                         self.prompt_manager,
                     )
                 elif name == "stop_servers":
-                    result = await handle_stop(arguments, self.docker_client, self.proxy)
+                    result = await handle_stop(
+                        arguments, self.docker_client, self.cache, self.proxy
+                    )
                 elif name == "get_active_servers":
                     result = await handle_get_active(
                         arguments, self.docker_client, self.proxy
@@ -268,11 +276,14 @@ class OrchestratorServer:
                 server_version="0.1.0",
                 capabilities=ServerCapabilities(),
             )
-            await self.server.run(
-                read_stream,
-                write_stream,
-                initialization_options,
-            )
+            try:
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    initialization_options,
+                )
+            finally:
+                await self.connection_pool.close_all()
 
 
 async def main():
@@ -1 +1,35 @@
 """Tools module for Orchestrator."""
+
+from mcp.types import Tool
+
+from .config import config_get, config_set, secret_list, secret_remove, secret_set
+from .info import get_info, get_tools
+from .proxy import call_tool, list_active_tools
+from .servers import get_active, list_catalog, list_installed, start, stop
+
+# Definitions of all orchestrator tools, in listing order
+_ALL_TOOLS: tuple[Tool, ...] = (
+    # Server management
+    list_installed.get_tool(),
+    list_catalog.get_tool(),
+    start.get_tool(),
+    stop.get_tool(),
+    get_active.get_tool(),
+    # Information
+    get_tools.get_tool(),
+    get_info.get_tool(),
+    # Configuration
+    config_set.get_tool(),
+    config_get.get_tool(),
+    secret_set.get_tool(),
+    secret_list.get_tool(),
+    secret_remove.get_tool(),
+    # Proxy
+    call_tool.get_tool(),
+    list_active_tools.get_tool(),
+)
+
+
+def get_all_static_tools() -> tuple[Tool, ...]:
+    """Get definitions of all orchestrator tools (shared, must not be modified)."""
+    return _ALL_TOOLS
@@ -7,21 +7,24 @@ from mcp.types import Tool
 from ...docker_client import DockerMCPClient
 
 
-def get_tool() -> Tool:
-    """Get config_get tool definition."""
-    return Tool(
-        name="config_get",
-        description="Get current MCP configuration",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "server": {
-                    "type": "string",
-                    "description": "Server name (optional, for server-specific config)",
-                },
+_TOOL = Tool(
+    name="config_get",
+    description="Get current MCP configuration",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "server": {
+                "type": "string",
+                "description": "Server name (optional, for server-specific config)",
             },
         },
-    )
+    },
+)
+
+
+def get_tool() -> Tool:
+    """Get config_get tool definition."""
+    return _TOOL
 
 
 async def handle_tool(
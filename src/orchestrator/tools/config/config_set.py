@@ -11,26 +11,29 @@ from ...exceptions import CommandError
 logger = logging.getLogger(__name__)
 
 
-def get_tool() -> Tool:
-    """Get config_set tool definition."""
-    return Tool(
-        name="config_set",
-        description="Set configuration for MCP servers (e.g., database URLs, API endpoints)",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "server": {
-                    "type": "string",
-                    "description": "Server name (optional, for server-specific config)",
-                },
-                "config": {
-                    "type": "object",
-                    "description": "Configuration dictionary (key-value pairs)",
-                },
+_TOOL = Tool(
+    name="config_set",
+    description="Set configuration for MCP servers (e.g., database URLs, API endpoints)",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "server": {
+                "type": "string",
+                "description": "Server name (optional, for server-specific config)",
+            },
+            "config": {
+                "type": "object",
+                "description": "Configuration dictionary (key-value pairs)",
             },
-            "required": ["config"],
         },
-    )
+        "required": ["config"],
+    },
+)
+
+
+def get_tool() -> Tool:
+    """Get config_set tool definition."""
+    return _TOOL
 
 
 async def handle_tool(
@@ -7,16 +7,19 @@ from mcp.types import Tool
 from ...docker_client import DockerMCPClient
 
 
+_TOOL = Tool(
+    name="secret_list",
+    description="List all configured secrets (keys only, not values)",
+    inputSchema={
+        "type": "object",
+        "properties": {},
+    },
+)
+
+
 def get_tool() -> Tool:
     """Get secret_list tool definition."""
-    return Tool(
-        name="secret_list",
-        description="List all configured secrets (keys only, not values)",
-        inputSchema={
-            "type": "object",
-            "properties": {},
-        },
-    )
+    return _TOOL
 
 
 async def handle_tool(
@@ -7,22 +7,25 @@ from mcp.types import Tool
 from ...docker_client import DockerMCPClient
 
 
-def get_tool() -> Tool:
-    """Get secret_remove tool definition."""
-    return Tool(
-        name="secret_remove",
-        description="Remove a secret",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "key": {
-                    "type": "string",
-                    "description": "Secret key name to remove",
-                },
+_TOOL = Tool(
+    name="secret_remove",
+    description="Remove a secret",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "key": {
+                "type": "string",
+                "description": "Secret key name to remove",
             },
-            "required": ["key"],
         },
-    )
+        "required": ["key"],
+    },
+)
+
+
+def get_tool() -> Tool:
+    """Get secret_remove tool definition."""
+    return _TOOL
 
 
 async def handle_tool(
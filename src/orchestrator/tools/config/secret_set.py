@@ -7,26 +7,29 @@ from mcp.types import Tool
 from ...docker_client import DockerMCPClient
 
 
-def get_tool() -> Tool:
-    """Get secret_set tool definition."""
-    return Tool(
-        name="secret_set",
-        description="Set a secret (e.g., API keys, passwords) for MCP servers",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "key": {
-                    "type": "string",
-                    "description": "Secret key name",
-                },
-                "value": {
-                    "type": "string",
-                    "description": "Secret value",
-                },
+_TOOL = Tool(
+    name="secret_set",
+    description="Set a secret (e.g., API keys, passwords) for MCP servers",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "key": {
+                "type": "string",
+                "description": "Secret key name",
+            },
+            "value": {
+                "type": "string",
+                "description": "Secret value",
             },
-            "required": ["key", "value"],
         },
-    )
+        "required": ["key", "value"],
+    },
+)
+
+
+def get_tool() -> Tool:
+    """Get secret_set tool definition."""
+    return _TOOL
 
 
 async def handle_tool(
@@ -8,22 +8,25 @@ from ...cache import MetadataCache
 from ...docker_client import DockerMCPClient
 
 
+_TOOL = Tool(
+    name="get_server_info",
+    description="Get detailed information about a specific MCP server including description, requirements, and configuration",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "server": {
+                "type": "string",
+                "description": "Server name",
+            }
+        },
+        "required": ["server"],
+    },
+)
+
+
 def get_tool() -> Tool:
     """Get get_server_info tool definition."""
-    return Tool(
-        name="get_server_info",
-        description="Get detailed information about a specific MCP server including description, requirements, and configuration",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "server": {
-                    "type": "string",
-                    "description": "Server name",
-                }
-            },
-            "required": ["server"],
-        },
-    )
+    return _TOOL
 
 
 async def handle_tool(
@@ -49,19 +52,7 @@ async def handle_tool(
     async def fetch_info():
         return await docker_client.get_server_info(server)
 
-    metadata = await cache.get_server_metadata(server, fetch_info)
-
-    if not metadata:
+    info = await cache.get_server_info_serialized(server, fetch_info)
+    if info is None:
         return {"error": f"Server {server} not found"}
-
-    return {
-        "name": metadata.name,
-        "description": metadata.description,
-        "version": metadata.version,
-        "keywords": metadata.keywords,
-        "tools_count": metadata.tools_count,
-        "tools_preview": metadata.tools_preview,
-        "catalog_source": metadata.catalog_source,
-        "has_prompt": metadata.prompt is not None,
-        "config_requirements": metadata.config_requirements,
-    }
+    return info
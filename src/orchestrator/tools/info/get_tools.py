@@ -8,22 +8,25 @@ from ...cache import MetadataCache
 from ...docker_client import DockerMCPClient
 
 
+_TOOL = Tool(
+    name="get_server_tools",
+    description="Get list of tools provided by a specific MCP server (metadata only, server doesn't need to be running)",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "server": {
+                "type": "string",
+                "description": "Server name",
+            }
+        },
+        "required": ["server"],
+    },
+)
+
+
 def get_tool() -> Tool:
     """Get get_server_tools tool definition."""
-    return Tool(
-        name="get_server_tools",
-        description="Get list of tools provided by a specific MCP server (metadata only, server doesn't need to be running)",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "server": {
-                    "type": "string",
-                    "description": "Server name",
-                }
-            },
-            "required": ["server"],
-        },
-    )
+    return _TOOL
 
 
 async def handle_tool(
@@ -47,19 +50,7 @@ async def handle_tool(
         return {"error": "Server name is required"}
 
     async def fetch_tools():
-        return await docker_client.get_server_tools(server)
-
-    tools = await cache.get_server_tools(server, fetch_tools)
+        tools_by_server = await cache.get_all_tools(docker_client.get_all_tools_by_server)
+        return tools_by_server.get(server, [])
 
-    return {
-        "server": server,
-        "tools_count": len(tools),
-        "tools": [
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "inputSchema": tool.inputSchema,
-            }
-            for tool in tools
-        ],
-    }
+    return await cache.get_server_tools_serialized(server, fetch_tools)
@@ -8,26 +8,29 @@ from ...models import CallToolResult
 from ...proxy import ToolProxy
 
 
-def get_tool() -> Tool:
-    """Get call_tool tool definition."""
-    return Tool(
-        name="call_tool",
-        description="Call a tool from an active MCP server through Orchestrator proxy. This is the ONLY way to call tools from started servers.",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "tool_name": {
-                    "type": "string",
-                    "description": "Name of the tool to call",
-                },
-                "arguments": {
-                    "type": "object",
-                    "description": "Tool arguments (key-value pairs)",
-                },
+_TOOL = Tool(
+    name="call_tool",
+    description="Call a tool from an active MCP server through Orchestrator proxy. This is the ONLY way to call tools from started servers.",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "tool_name": {
+                "type": "string",
+                "description": "Name of the tool to call",
+            },
+            "arguments": {
+                "type": "object",
+                "description": "Tool arguments (key-value pairs)",
             },
-            "required": ["tool_name", "arguments"],
         },
-    )
+        "required": ["tool_name", "arguments"],
+    },
+)
+
+
+def get_tool() -> Tool:
+    """Get call_tool tool definition."""
+    return _TOOL
 
 
 async def handle_tool(
@@ -1,5 +1,6 @@
 """Get active servers tool."""
 
+import itertools
 from typing import Any
 
 from mcp.types import Tool
@@ -8,16 +9,19 @@ from ...docker_client import DockerMCPClient
 from ...proxy import ToolProxy
 
 
+_TOOL = Tool(
+    name="get_active_servers",
+    description="Get list of currently active (running) MCP servers",
+    inputSchema={
+        "type": "object",
+        "properties": {},
+    },
+)
+
+
 def get_tool() -> Tool:
     """Get get_active_servers tool definition."""
-    return Tool(
-        name="get_active_servers",
-        description="Get list of currently active (running) MCP servers",
-        inputSchema={
-            "type": "object",
-            "properties": {},
-        },
-    )
+    return _TOOL
 
 
 async def handle_tool(
@@ -42,23 +46,22 @@ async def handle_tool(
     # Also get servers registered in proxy
     proxy_servers = proxy.list_servers()
 
-    # Combine and deduplicate
-    all_active = list(set(active_servers + proxy_servers))
+    # Combine and deduplicate, keeping Docker's order first
+    all_active = list(dict.fromkeys(itertools.chain(active_servers, proxy_servers)))
 
     # Get tools for each server
-    result = {
-        "servers": all_active,
-        "servers_detail": [],
-    }
-
+    servers_detail = []
     for server in all_active:
-        tools = proxy.get_server_tools(server)
-        result["servers_detail"].append(
+        tool_names = proxy.get_server_tool_names(server)
+        servers_detail.append(
             {
                 "name": server,
-                "tools_count": len(tools),
-                "tools": [tool.name for tool in tools],
+                "tools_count": len(tool_names),
+                "tools": tool_names,
             }
         )
 
-    return result
+    return {
+        "servers": all_active,
+        "servers_detail": servers_detail,
+    }
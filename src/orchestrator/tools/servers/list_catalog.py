@@ -8,22 +8,25 @@ from ...cache import MetadataCache
 from ...docker_client import DockerMCPClient
 
 
+_TOOL = Tool(
+    name="list_catalog_servers",
+    description="Get list of all available servers in Docker MCP Catalog (for installation)",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "catalog": {
+                "type": "string",
+                "description": "Catalog name (default: docker-mcp)",
+                "default": "docker-mcp",
+            }
+        },
+    },
+)
+
+
 def get_tool() -> Tool:
     """Get list_catalog_servers tool definition."""
-    return Tool(
-        name="list_catalog_servers",
-        description="Get list of all available servers in Docker MCP Catalog (for installation)",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "catalog": {
-                    "type": "string",
-                    "description": "Catalog name (default: docker-mcp)",
-                    "default": "docker-mcp",
-                }
-            },
-        },
-    )
+    return _TOOL
 
 
 async def handle_tool(
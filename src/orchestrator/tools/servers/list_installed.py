@@ -8,22 +8,25 @@ from ...cache import MetadataCache
 from ...docker_client import DockerMCPClient
 
 
+_TOOL = Tool(
+    name="list_installed_servers",
+    description="Get list of installed MCP servers from Docker MCP Catalog",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "catalog": {
+                "type": "string",
+                "description": "Catalog name (default: docker-mcp)",
+                "default": "docker-mcp",
+            }
+        },
+    },
+)
+
+
 def get_tool() -> Tool:
     """Get list_installed_servers tool definition."""
-    return Tool(
-        name="list_installed_servers",
-        description="Get list of installed MCP servers from Docker MCP Catalog",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "catalog": {
-                    "type": "string",
-                    "description": "Catalog name (default: docker-mcp)",
-                    "default": "docker-mcp",
-                }
-            },
-        },
-    )
+    return _TOOL
 
 
 async def handle_tool(
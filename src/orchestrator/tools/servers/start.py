@@ -1,5 +1,6 @@
 """Start servers tool."""
 
+import asyncio
 import logging
 from typing import Any
 
@@ -15,23 +16,26 @@ from ...proxy import ToolProxy
 logger = logging.getLogger(__name__)
 
 
+_TOOL = Tool(
+    name="start_servers",
+    description="Start specified MCP servers and enable their tools. Returns list of available tools and prompts.",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "servers": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "List of server names to start",
+            }
+        },
+        "required": ["servers"],
+    },
+)
+
+
 def get_tool() -> Tool:
     """Get start_servers tool definition."""
-    return Tool(
-        name="start_servers",
-        description="Start specified MCP servers and enable their tools. Returns list of available tools and prompts.",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "servers": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "List of server names to start",
-                }
-            },
-            "required": ["servers"],
-        },
-    )
+    return _TOOL
 
 
 async def handle_tool(
@@ -85,6 +89,9 @@ async def handle_tool(
             "prompts": {},
         }
 
+    # Tool listings fetched before the servers were enabled are stale
+    cache.invalidate_tools(servers)
+
     # Get tools for each server and register in proxy
     all_tools = []
     errors = {}
@@ -94,7 +101,11 @@ async def handle_tool(
         try:
             # Get tools from server
             async def fetch_tools():
-                return await docker_client.get_server_tools(server)
+                # One tools listing serves every server being started
+                tools_by_server = await cache.get_all_tools(
+                    docker_client.get_all_tools_by_server
+                )
+                return tools_by_server.get(server, [])
 
             tools = await cache.get_server_tools(server, fetch_tools)
 
@@ -115,8 +126,11 @@ async def handle_tool(
             errors[server] = f"Unexpected error: {str(e)}"
             logger.error(f"Error starting server {server}: {e}", exc_info=True)
 
-    # Get prompts for successful servers
-    prompts = await prompt_manager.get_prompts_for_servers(successful_servers)
+    # Get prompts and open connections for successful servers concurrently
+    prompts, _ = await asyncio.gather(
+        prompt_manager.get_prompts_for_servers(successful_servers),
+        proxy.connect_servers(successful_servers),
+    )
 
     # Format tools for response
     tools_data = [
@@ -5,6 +5,7 @@ from typing import Any
 
 from mcp.types import Tool
 
+from ...cache import MetadataCache
 from ...docker_client import DockerMCPClient
 from ...exceptions import CommandError
 from ...proxy import ToolProxy
@@ -12,28 +13,32 @@ from ...proxy import ToolProxy
 logger = logging.getLogger(__name__)
 
 
+_TOOL = Tool(
+    name="stop_servers",
+    description="Stop specified MCP servers and disable their tools",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "servers": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "List of server names to stop",
+            }
+        },
+        "required": ["servers"],
+    },
+)
+
+
 def get_tool() -> Tool:
     """Get stop_servers tool definition."""
-    return Tool(
-        name="stop_servers",
-        description="Stop specified MCP servers and disable their tools",
-        inputSchema={
-            "type": "object",
-            "properties": {
-                "servers": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "List of server names to stop",
-                }
-            },
-            "required": ["servers"],
-        },
-    )
+    return _TOOL
 
 
 async def handle_tool(
     arguments: dict[str, Any],
     docker_client: DockerMCPClient,
+    cache: MetadataCache,
     proxy: ToolProxy,
 ) -> dict[str, Any]:
     """
@@ -42,6 +47,7 @@ async def handle_tool(
     Args:
         arguments: Tool arguments
         docker_client: Docker MCP Client
+        cache: Metadata cache
         proxy: Tool proxy
 
     Returns:
@@ -53,11 +59,12 @@ async def handle_tool(
 
     # Unregister from proxy first
     for server in servers:
-        proxy.unregister_server(server)
+        await proxy.unregister_server(server)
 
     # Disable servers through Docker MCP Toolkit
     try:
         await docker_client.disable_servers(servers)
+        cache.invalidate_tools(servers)
         return {"status": "success", "servers": servers}
     except CommandError as e:
         logger.error(f"Failed to disable servers: {e}")
@@ -1,16 +1,40 @@
 """Utility functions for Orchestrator."""
 
 import asyncio
-import json
 import logging
-from typing import Any, Dict, List, Optional
+import random
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import ijson
+import orjson
+
+from .exceptions import CommandError, ParseError
 
 logger = logging.getLogger(__name__)
 
+# Upper bound for the delay between command retries, in seconds
+MAX_BACKOFF = 30
+
+
+def _backoff(delay: float, attempt: int) -> float:
+    """
+    Compute the delay before retrying a command.
+
+    Args:
+        delay: Base delay in seconds
+        attempt: Zero-based number of the failed attempt
+
+    Returns:
+        Exponential delay capped at MAX_BACKOFF, plus up to 10% jitter so
+        concurrent retries against the Docker daemon don't line up
+    """
+    backoff = min(delay * (2 ** attempt), MAX_BACKOFF)
+    return backoff + random.uniform(0, 0.1) * backoff
+
 
 async def run_command(
     cmd: List[str], timeout: int = 30, retries: int = 3, delay: int = 1
-) -> tuple[str, int]:
+) -> tuple[bytes | str, int]:
     """
     Run a command asynchronously with retry logic.
 
@@ -21,7 +45,8 @@ async def run_command(
         delay: Delay between retries in seconds
 
     Returns:
-        Tuple of (stdout, return_code)
+        Tuple of (output, return_code): raw stdout bytes on success, so JSON output
+        is parsed without decoding it first, or the error message on failure
     """
     for attempt in range(retries):
         try:
@@ -30,68 +55,197 @@ async def run_command(
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(), timeout=timeout
-            )
+            async with asyncio.timeout(timeout):
+                stdout, stderr = await process.communicate()
 
             if process.returncode == 0:
-                return stdout.decode("utf-8"), 0
+                return stdout, 0
             else:
-                error_msg = stderr.decode("utf-8") if stderr else "Unknown error"
+                # Only the error branch decodes; stray bytes must not turn into a retry
+                error_msg = stderr.decode("utf-8", "replace") if stderr else "Unknown error"
                 logger.warning(
                     f"Command failed (attempt {attempt + 1}/{retries}): {error_msg}"
                 )
                 if attempt < retries - 1:
-                    await asyncio.sleep(delay * (2 ** attempt))  # Exponential backoff
+                    await asyncio.sleep(_backoff(delay, attempt))
                 else:
                     return error_msg, process.returncode
 
         except asyncio.TimeoutError:
             logger.warning(f"Command timeout (attempt {attempt + 1}/{retries})")
+            # Don't leave the timed-out process running
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
             if attempt < retries - 1:
-                await asyncio.sleep(delay * (2 ** attempt))
+                await asyncio.sleep(_backoff(delay, attempt))
             else:
                 return "Command timeout", -1
 
         except Exception as e:
             logger.error(f"Error running command: {e}")
             if attempt < retries - 1:
-                await asyncio.sleep(delay * (2 ** attempt))
+                await asyncio.sleep(_backoff(delay, attempt))
             else:
                 return str(e), -1
 
     return "Max retries exceeded", -1
 
 
-def parse_json_output(output: str) -> Optional[Dict[str, Any]]:
+class _DeadlineReader:
+    """Stream reader wrapper enforcing an overall deadline on reads."""
+
+    def __init__(self, reader: asyncio.StreamReader, timeout: float):
+        """
+        Initialize reader.
+
+        Args:
+            reader: Underlying stream reader
+            timeout: Total time allowed for all reads in seconds
+        """
+        self._reader = reader
+        self._loop = asyncio.get_running_loop()
+        self._deadline = self._loop.time() + timeout
+        # Whether anything but whitespace was read
+        self.received = False
+
+    def remaining(self) -> float:
+        """Get time left until the deadline in seconds."""
+        return self._deadline - self._loop.time()
+
+    async def read(self, n: int = -1) -> bytes:
+        """Read up to n bytes before the deadline."""
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise asyncio.TimeoutError()
+        data = await asyncio.wait_for(self._reader.read(n), timeout=remaining)
+        if not self.received and data.strip():
+            self.received = True
+        return data
+
+
+async def stream_json_items(
+    cmd: List[str], prefixes: tuple[str, ...], timeout: int = 30
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Run a command and yield JSON objects from its output as they are parsed.
+
+    Objects found at any of the given ijson prefixes (e.g. "item" for elements of
+    a top-level array) are yielded as soon as they are complete, so parsing
+    overlaps with the command still writing its output. Empty output yields nothing.
+
+    Args:
+        cmd: Command to run
+        prefixes: ijson prefixes of the objects to yield
+        timeout: Command timeout in seconds
+
+    Yields:
+        Parsed JSON objects
+
+    Raises:
+        CommandError: If command fails or times out
+        ParseError: If output is not valid JSON
+    """
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    # Drain stderr concurrently so the command can't block on a full pipe
+    stderr_task = asyncio.create_task(process.stderr.read())
+    reader = _DeadlineReader(process.stdout, timeout)
+    try:
+        parse_error = None
+        builder = None
+        item_prefix = None
+        try:
+            async for prefix, event, value in ijson.parse_async(reader, use_float=True):
+                if builder is None:
+                    if event != "start_map" or prefix not in prefixes:
+                        continue
+                    builder = ijson.ObjectBuilder()
+                    item_prefix = prefix
+                builder.event(event, value)
+                if event == "end_map" and prefix == item_prefix:
+                    yield builder.value
+                    builder = None
+        except ijson.JSONError as e:
+            parse_error = e
+            # Consume the rest of the output, so the command can finish writing it
+            while await reader.read(65536):
+                pass
+
+        await asyncio.wait_for(process.wait(), timeout=max(reader.remaining(), 0))
+        stderr = await stderr_task
+        if process.returncode != 0:
+            error_msg = stderr.decode("utf-8", "replace") if stderr else "Unknown error"
+            raise CommandError(cmd, process.returncode, stderr=error_msg)
+        if parse_error and reader.received:
+            raise ParseError(" ".join(cmd) + " output", reason=str(parse_error)) from parse_error
+    except asyncio.TimeoutError as e:
+        raise CommandError(cmd, -1, stderr=f"Timeout after {timeout} seconds") from e
+    finally:
+        if process.returncode is None:
+            process.kill()
+        stderr_task.cancel()
+        # Unread output keeps the pipe paused, and the process is only reaped
+        # once its pipes are closed
+        await process.stdout.read()
+        await process.wait()
+
+
+def parse_json_output(output: str | bytes) -> Optional[Dict[str, Any]]:
     """
     Parse JSON output from command.
 
     Args:
-        output: JSON string output
+        output: JSON output as string or raw bytes
 
     Returns:
         Parsed JSON dictionary or None if parsing fails
     """
     try:
-        return json.loads(output)
-    except json.JSONDecodeError as e:
+        return orjson.loads(output)
+    except orjson.JSONDecodeError as e:
         logger.error(f"Failed to parse JSON: {e}")
         return None
 
 
-def find_tool_server(tool_name: str, servers: Dict[str, List[str]]) -> Optional[str]:
+def build_tool_index(servers: Dict[str, List[str]]) -> Dict[str, str]:
+    """
+    Build a reverse index from tool names to the servers providing them.
+
+    Args:
+        servers: Dictionary mapping server names to their tool names
+
+    Returns:
+        Dictionary mapping tool names to server names; a tool provided by several
+        servers maps to the first one, as with find_tool_server
+    """
+    index: Dict[str, str] = {}
+    for server, tools in servers.items():
+        for tool in tools:
+            index.setdefault(tool, server)
+    return index
+
+
+def find_tool_server(
+    tool_name: str,
+    servers: Dict[str, List[str]],
+    index: Optional[Dict[str, str]] = None,
+) -> Optional[str]:
     """
     Find which server provides a specific tool.
 
     Args:
         tool_name: Name of the tool
         servers: Dictionary mapping server names to their tool names
+        index: Index built by build_tool_index, for repeated lookups against
+            the same servers
 
     Returns:
         Server name that provides the tool, or None if not found
     """
-    for server, tools in servers.items():
-        if tool_name in tools:
-            return server
-    return None
+    if index is not None:
+        return index.get(tool_name)
+    return next((server for server, tools in servers.items() if tool_name in tools), None)
@@ -0,0 +1,98 @@
+"""Tests for the call batcher."""
+
+import asyncio
+
+import pytest
+
+from orchestrator.batcher import AsyncBatcher
+
+
+async def test_concurrent_items_are_batched_and_fanned_out():
+    batches = []
+
+    async def process(items):
+        batches.append(items)
+        return [item * 2 for item in items]
+
+    batcher = AsyncBatcher(process, max_batch=4, max_wait_ms=50)
+    results = await asyncio.gather(*(batcher.run(i) for i in range(10)))
+
+    assert results == [i * 2 for i in range(10)]
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    assert sorted(item for batch in batches for item in batch) == list(range(10))
+
+
+async def test_item_exception_fails_only_its_item():
+    async def process(items):
+        return [ValueError(item) if item == 1 else item for item in items]
+
+    batcher = AsyncBatcher(process)
+    results = await asyncio.gather(*(batcher.run(i) for i in range(3)), return_exceptions=True)
+
+    assert results[0] == 0
+    assert isinstance(results[1], ValueError)
+    assert results[2] == 2
+
+
+async def test_batch_failure_fails_every_item():
+    async def process(items):
+        raise RuntimeError("batch failed")
+
+    batcher = AsyncBatcher(process)
+    results = await asyncio.gather(*(batcher.run(i) for i in range(3)), return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+async def test_batcher_recovers_after_failed_batch():
+    calls = 0
+
+    async def process(items):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("first batch failed")
+        return items
+
+    batcher = AsyncBatcher(process)
+    with pytest.raises(RuntimeError):
+        await batcher.run(1)
+    assert await batcher.run(2) == 2
+
+
+async def test_cancelled_submitter_does_not_affect_others():
+    release = asyncio.Event()
+
+    async def process(items):
+        await release.wait()
+        return items
+
+    batcher = AsyncBatcher(process, max_wait_ms=20)
+    first = asyncio.create_task(batcher.run(1))
+    second = asyncio.create_task(batcher.run(2))
+    await asyncio.sleep(0.05)
+
+    first.cancel()
+    release.set()
+
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    assert await second == 2
+
+
+async def test_cancelled_batch_cancels_its_items():
+    started = asyncio.Event()
+
+    async def process(items):
+        started.set()
+        await asyncio.Event().wait()
+
+    batcher = AsyncBatcher(process)
+    run = asyncio.create_task(batcher.run(1))
+    await started.wait()
+
+    for dispatch in list(batcher._dispatches):
+        dispatch.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await run
@@ -0,0 +1,215 @@
+"""Tests for the metadata cache."""
+
+import asyncio
+
+import pytest
+
+from orchestrator.cache import DiskStore, MetadataCache
+from orchestrator.models import ServerMetadata, Tool
+
+
+class CountingFetch:
+    """Fetch function counting calls, optionally held until released."""
+
+    def __init__(self, result=None, error=None):
+        self.result = result
+        self.error = error
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        if self.error:
+            raise self.error
+        return self.result
+
+
+def tools(*names: str) -> list[Tool]:
+    """Build a tool list."""
+    return [Tool(name=name) for name in names]
+
+
+async def test_concurrent_misses_share_one_fetch():
+    cache = MetadataCache()
+    fetch = CountingFetch(tools("a"))
+    fetch.release.clear()
+
+    callers = [asyncio.create_task(cache.get_server_tools("s", fetch)) for _ in range(5)]
+    await asyncio.sleep(0)
+    fetch.release.set()
+    results = await asyncio.gather(*callers)
+
+    assert fetch.calls == 1
+    assert all(result is results[0] for result in results)
+    # Served from memory afterwards
+    assert await cache.get_server_tools("s", fetch) is results[0]
+    assert fetch.calls == 1
+
+
+async def test_cancelled_first_caller_does_not_cancel_waiters():
+    cache = MetadataCache()
+    fetch = CountingFetch(tools("a"))
+    fetch.release.clear()
+
+    first = asyncio.create_task(cache.get_server_tools("s", fetch))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(cache.get_server_tools("s", fetch))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    fetch.release.set()
+
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    assert await second == tools("a")
+    assert fetch.calls == 1
+
+
+async def test_fetch_error_reaches_every_caller_and_is_not_cached():
+    cache = MetadataCache()
+    fetch = CountingFetch(error=RuntimeError("down"))
+    fetch.release.clear()
+
+    callers = [asyncio.create_task(cache.get_server_tools("s", fetch)) for _ in range(3)]
+    await asyncio.sleep(0)
+    fetch.release.set()
+    results = await asyncio.gather(*callers, return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert fetch.calls == 1
+
+    fetch.error = None
+    fetch.result = tools("a")
+    assert await cache.get_server_tools("s", fetch) == tools("a")
+    assert fetch.calls == 2
+
+
+async def test_missing_metadata_is_remembered_for_negative_ttl():
+    cache = MetadataCache(negative_ttl=0)
+    fetch = CountingFetch(None)
+
+    assert await cache.get_server_metadata("s", fetch) is None
+    assert await cache.get_server_metadata("s", fetch) is None
+    # Expired immediately, so absence is not remembered
+    assert fetch.calls == 2
+
+    cache = MetadataCache(negative_ttl=60)
+    fetch = CountingFetch(None)
+    await cache.get_server_metadata("s", fetch)
+    await cache.get_server_metadata("s", fetch)
+    assert fetch.calls == 1
+
+
+async def test_least_recently_used_entries_are_evicted():
+    cache = MetadataCache(max_entries=2)
+    fetch = CountingFetch(tools("a"))
+
+    for server in ("s1", "s2", "s3"):
+        await cache.get_server_tools(server, fetch)
+    await cache.get_server_tools("s1", fetch)
+
+    assert fetch.calls == 4
+
+
+async def test_serialized_view_is_reused_until_refetch():
+    cache = MetadataCache()
+    fetch = CountingFetch(tools("a"))
+
+    view = await cache.get_server_tools_serialized("s", fetch)
+    assert await cache.get_server_tools_serialized("s", fetch) is view
+    assert view["tools_count"] == 1
+
+    cache.invalidate_tools(["s"])
+    assert await cache.get_server_tools_serialized("s", fetch) is not view
+
+
+async def test_invalidate_tools_drops_all_tools_snapshot():
+    cache = MetadataCache()
+    fetch = CountingFetch({"s": tools("a")})
+
+    await cache.get_all_tools(fetch)
+    cache.invalidate_tools(["s"])
+    await cache.get_all_tools(fetch)
+
+    assert fetch.calls == 2
+
+
+async def test_fetch_started_before_invalidation_is_not_stored(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = MetadataCache(persist_path=path)
+    stale = CountingFetch({"s1": tools("a")})
+    stale.release.clear()
+
+    first = asyncio.create_task(cache.get_all_tools(stale))
+    await asyncio.sleep(0.05)
+    cache.invalidate_tools(["s2"])
+
+    # A lookup after the invalidation does not join the stale fetch
+    fresh = CountingFetch({"s1": tools("a"), "s2": tools("b")})
+    assert await asyncio.wait_for(cache.get_all_tools(fresh), 1) == fresh.result
+    stale.release.set()
+    assert await first == stale.result
+
+    assert await cache.get_all_tools(CountingFetch()) == fresh.result
+    restored = MetadataCache(persist_path=path)
+    assert await restored.get_all_tools(CountingFetch()) == fresh.result
+
+
+async def test_disk_store_round_trip(tmp_path):
+    store = DiskStore(str(tmp_path / "cache.db"))
+
+    await store.set("permanent", b"1", None)
+    await store.set("expiring", b"2", 60)
+    await store.set("expired", b"3", -1)
+
+    assert await store.get("permanent") == (b"1", None)
+    value, remaining = await store.get("expiring")
+    assert value == b"2" and 0 < remaining <= 60
+    assert await store.get("expired") is None
+    assert await store.get("missing") is None
+
+
+async def test_disk_store_deletes_apply_in_order(tmp_path):
+    store = DiskStore(str(tmp_path / "cache.db"))
+    await store.set("a:1", b"1", None)
+    await store.set("a:2", b"2", None)
+    await store.set("b:1", b"3", None)
+
+    store.delete("a:1")
+    store.delete_prefix("b:")
+
+    assert await store.get("a:1") is None
+    assert await store.get("a:2") == (b"2", None)
+    assert await store.get("b:1") is None
+
+
+async def test_cache_is_restored_from_disk(tmp_path):
+    path = str(tmp_path / "cache.db")
+    metadata = ServerMetadata(name="s", description="server")
+
+    cache = MetadataCache(persist_path=path)
+    await cache.get_server_metadata("s", CountingFetch(metadata))
+
+    fetch = CountingFetch(None)
+    restored = MetadataCache(persist_path=path)
+    assert await restored.get_server_metadata("s", fetch) == metadata
+    assert fetch.calls == 0
+
+
+async def test_invalid_disk_entry_is_discarded_and_refetched(tmp_path):
+    path = str(tmp_path / "cache.db")
+    store = DiskStore(path)
+    await store.set("server tools:s", b'[{"unexpected": true}]', None)
+
+    cache = MetadataCache(persist_path=path)
+    fetch = CountingFetch(tools("a"))
+    assert await cache.get_server_tools("s", fetch) == tools("a")
+    assert fetch.calls == 1
+
+    # The refetched value replaced the invalid row
+    restored = MetadataCache(persist_path=path)
+    fetch = CountingFetch(None)
+    assert await restored.get_server_tools("s", fetch) == tools("a")
+    assert fetch.calls == 0
@@ -0,0 +1,130 @@
+"""Tests for the MCP connection pool."""
+
+import asyncio
+import builtins
+from contextlib import asynccontextmanager
+
+import anyio
+import pytest
+from mcp import StdioServerParameters
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED, INVALID_PARAMS, CallToolResult, ErrorData, TextContent
+
+from orchestrator import connection_pool
+from orchestrator.connection_pool import (
+    MCPConnectionPool,
+    ServerConnection,
+    ServerInfo,
+    _is_transport_error,
+)
+from orchestrator.docker_client import DockerMCPClient
+from orchestrator.exceptions import ConnectionError
+
+
+def mcp_error(code: int) -> McpError:
+    """Build an MCP error response."""
+    return McpError(ErrorData(code=code, message=f"error {code}"))
+
+
+class StubSession:
+    """Client session answering tool calls, failing those listed in errors."""
+
+    def __init__(self, errors: dict):
+        self.errors = errors
+        self.calls = []
+
+    async def call_tool(self, tool_name, arguments):
+        self.calls.append(arguments["n"])
+        error = self.errors.get(arguments["n"])
+        if error:
+            raise error
+        return CallToolResult(content=[TextContent(type="text", text=str(arguments["n"]))])
+
+
+@pytest.fixture
+async def pool(monkeypatch):
+    """Connection pool whose connections open stub sessions, one per entry of pool.errors."""
+    pool = MCPConnectionPool(DockerMCPClient(), reconnect_delay=0)
+    pool.errors = []
+    pool.sessions = []
+
+    async def open_stub(connection, params, timeout):
+        connection.session = StubSession(pool.errors.pop(0) if pool.errors else {})
+        pool.sessions.append(connection.session)
+        return connection.session
+
+    async def active(server):
+        return ServerInfo(server, is_active=True)
+
+    monkeypatch.setattr(ServerConnection, "open", open_stub)
+    monkeypatch.setattr(pool, "get_server_info", active)
+    yield pool
+    await pool.close_all()
+
+
+def texts(results: list) -> list:
+    """Get the text of each successful result, or the exception."""
+    return [r if isinstance(r, BaseException) else r["content"][0]["text"] for r in results]
+
+
+async def test_open_fails_when_session_task_is_cancelled_before_ready(monkeypatch):
+    @asynccontextmanager
+    async def cancelled_client(params):
+        # As when an anyio cancel scope cancels the task owning the transport
+        raise asyncio.CancelledError()
+        yield
+
+    monkeypatch.setattr(connection_pool, "stdio_client", cancelled_client)
+    connection = ServerConnection("s")
+
+    with pytest.raises(ConnectionError):
+        await asyncio.wait_for(connection.open(StdioServerParameters(command="true"), 1), 5)
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (mcp_error(CONNECTION_CLOSED), True),
+        (anyio.ClosedResourceError(), True),
+        (anyio.BrokenResourceError(), True),
+        (builtins.ConnectionError(), True),
+        (EOFError(), True),
+        (mcp_error(INVALID_PARAMS), False),
+        (ValueError(), False),
+        (ConnectionError("s"), False),
+    ],
+)
+def test_is_transport_error(error, expected):
+    assert _is_transport_error(error) is expected
+
+
+async def test_batch_retries_only_transport_failures_once_on_new_session(pool):
+    closed = mcp_error(CONNECTION_CLOSED)
+    invalid = mcp_error(INVALID_PARAMS)
+    pool.errors = [{2: closed, 3: invalid}]
+
+    results = await pool.call_tool_batch("t", [{"n": 1}, {"n": 2}, {"n": 3}], "s")
+
+    assert texts(results) == ["1", "2", invalid]
+    assert len(pool.sessions) == 2
+    assert pool.sessions[1].calls == [2]
+
+
+async def test_batch_tool_errors_do_not_reconnect(pool):
+    invalid = mcp_error(INVALID_PARAMS)
+    pool.errors = [{1: invalid}]
+
+    results = await pool.call_tool_batch("t", [{"n": 1}, {"n": 2}], "s")
+
+    assert texts(results) == [invalid, "2"]
+    assert len(pool.sessions) == 1
+
+
+async def test_batch_transport_failure_is_retried_only_once(pool):
+    first, second = anyio.ClosedResourceError(), anyio.ClosedResourceError()
+    pool.errors = [{1: first}, {1: second}]
+
+    results = await pool.call_tool_batch("t", [{"n": 1}], "s")
+
+    assert texts(results) == [second]
+    assert len(pool.sessions) == 2
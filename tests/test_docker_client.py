@@ -0,0 +1,104 @@
+"""Tests for the Docker MCP Toolkit client."""
+
+import asyncio
+import json
+import sys
+
+import pytest
+
+from orchestrator.docker_client import DockerMCPClient
+from orchestrator.exceptions import CommandError
+
+# Stands in for the docker-mcp plugin: logs each invocation and answers a few commands
+FAKE_PLUGIN = """
+import json
+import sys
+import time
+
+args = sys.argv[1:]
+stdin = sys.stdin.read() if args == ["config", "write"] else None
+with open(sys.argv[0] + ".log", "a") as log:
+    log.write(json.dumps({"args": args, "stdin": stdin}) + "\\n")
+
+if args == ["config", "read"]:
+    time.sleep(0.2)
+    print(json.dumps({"fetch": {"timeout": 5}}))
+elif args == ["config", "write"] and "fail" in json.loads(stdin):
+    sys.exit("rejected")
+"""
+
+
+@pytest.fixture
+def plugin(tmp_path):
+    """Path to a fake docker-mcp plugin."""
+    path = tmp_path / "docker-mcp"
+    path.write_text(f"#!{sys.executable}\n{FAKE_PLUGIN}")
+    path.chmod(0o755)
+    return path
+
+
+def calls(plugin) -> list[dict]:
+    """Get the invocations of the fake plugin so far."""
+    log = plugin.with_name(plugin.name + ".log")
+    if not log.exists():
+        return []
+    return [json.loads(line) for line in log.read_text().splitlines()]
+
+
+async def test_config_write_skips_unchanged_config(plugin):
+    client = DockerMCPClient(plugin_path=str(plugin))
+
+    assert await client.config_write({"a": {"x": 1}, "b": 2})
+    assert await client.config_write({"b": 2, "a": {"x": 1}})
+    assert len(calls(plugin)) == 1
+    assert json.loads(calls(plugin)[0]["stdin"]) == {"a": {"x": 1}, "b": 2}
+
+    assert await client.config_write({"a": {"x": 2}, "b": 2})
+    assert len(calls(plugin)) == 2
+
+
+async def test_config_write_skips_config_just_read(plugin):
+    client = DockerMCPClient(plugin_path=str(plugin))
+
+    config = await client.config_read()
+    assert await client.config_write(config)
+
+    assert [call["args"] for call in calls(plugin)] == [["config", "read"]]
+
+
+async def test_config_write_rewrites_after_failed_write(plugin):
+    client = DockerMCPClient(plugin_path=str(plugin))
+
+    await client.config_write({"a": 1})
+    with pytest.raises(CommandError):
+        await client.config_write({"fail": True})
+    # The failed write may have changed the stored config, so write again
+    await client.config_write({"a": 1})
+
+    assert len(calls(plugin)) == 3
+
+
+async def test_concurrent_identical_queries_share_one_process(plugin):
+    client = DockerMCPClient(plugin_path=str(plugin))
+
+    results = await asyncio.gather(*(client.config_read() for _ in range(5)))
+
+    assert all(result == {"fetch": {"timeout": 5}} for result in results)
+    assert len(calls(plugin)) == 1
+    # Finished queries are not reused
+    await client.config_read()
+    assert len(calls(plugin)) == 2
+
+
+async def test_cancelled_query_caller_does_not_affect_others(plugin):
+    client = DockerMCPClient(plugin_path=str(plugin))
+
+    first = asyncio.create_task(client.config_read())
+    second = asyncio.create_task(client.config_read())
+    await asyncio.sleep(0.05)
+    first.cancel()
+
+    assert await second == {"fetch": {"timeout": 5}}
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    assert len(calls(plugin)) == 1
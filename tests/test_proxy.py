@@ -0,0 +1,88 @@
+"""Tests for the tool proxy."""
+
+from orchestrator.models import Tool
+from orchestrator.proxy import ToolProxy
+
+
+class StubPool:
+    """Connection pool accepting the calls made when servers are unregistered."""
+
+    async def remove_connection(self, server):
+        pass
+
+    async def invalidate_server_cache(self, server):
+        pass
+
+
+def expected_view(proxy: ToolProxy) -> dict:
+    """Build the list_active_tools response the way it was built tool by tool."""
+    all_tools = proxy.list_active_tools()
+    servers = proxy.list_servers()
+    return {
+        "total_tools": len(all_tools),
+        "servers": servers,
+        "tools_by_server": {
+            server: [
+                {"name": t.name, "description": t.description, "inputSchema": t.inputSchema}
+                for t in proxy.get_server_tools(server)
+            ]
+            for server in servers
+        },
+        "all_tools": [
+            {
+                "name": t.name,
+                "description": t.description,
+                "server": proxy.get_server_for_tool(t.name),
+            }
+            for t in all_tools
+        ],
+    }
+
+
+def make_proxy() -> ToolProxy:
+    """Build a proxy with two servers registered."""
+    proxy = ToolProxy(StubPool())
+    proxy.register_tools(
+        "s1",
+        [
+            Tool(name="a", description="A", inputSchema={"type": "object"}),
+            Tool(name="b"),
+        ],
+    )
+    proxy.register_tools("s2", [Tool(name="c", description="C")])
+    return proxy
+
+
+async def test_active_tools_view_matches_per_tool_build():
+    proxy = make_proxy()
+
+    view = proxy.build_active_tools_view()
+
+    assert view == expected_view(proxy)
+    assert view["servers"] == ["s1", "s2"]
+    assert [tool["server"] for tool in view["all_tools"]] == ["s1", "s1", "s2"]
+
+
+async def test_active_tools_view_is_kept_until_registrations_change():
+    proxy = make_proxy()
+    view = proxy.build_active_tools_view()
+    assert proxy.build_active_tools_view() is view
+
+    proxy.register_tools("s3", [Tool(name="d")])
+    view = proxy.build_active_tools_view()
+    assert view["total_tools"] == 4
+    assert view == expected_view(proxy)
+
+    await proxy.unregister_server("s1")
+    view = proxy.build_active_tools_view()
+    assert view["servers"] == ["s2", "s3"]
+    assert view == expected_view(proxy)
+
+
+async def test_empty_proxy_has_empty_view():
+    assert ToolProxy(StubPool()).build_active_tools_view() == {
+        "total_tools": 0,
+        "servers": [],
+        "tools_by_server": {},
+        "all_tools": [],
+    }
@@ -0,0 +1,61 @@
+"""Tests for command utilities."""
+
+import asyncio
+import sys
+
+import pytest
+
+from orchestrator.exceptions import CommandError, ParseError
+from orchestrator.utils import stream_json_items
+
+
+def python_cmd(code: str) -> list[str]:
+    """Build a command running a Python snippet."""
+    return [sys.executable, "-c", code]
+
+
+async def collect(cmd: list[str], timeout: int = 5) -> list[dict]:
+    """Collect all items streamed from a command."""
+    return [item async for item in stream_json_items(cmd, ("item", "tools.item"), timeout)]
+
+
+async def test_stream_yields_items_at_any_prefix():
+    items = await collect(python_cmd('print(\'{"tools": [{"a": 1}, {"b": [2.5]}]}\')'))
+    assert items == [{"a": 1}, {"b": [2.5]}]
+
+
+async def test_stream_empty_output_yields_nothing():
+    assert await collect(python_cmd("print()")) == []
+
+
+async def test_stream_failed_command_raises_command_error():
+    with pytest.raises(CommandError, match="boom"):
+        await collect(python_cmd("import sys; sys.stderr.write('boom'); sys.exit(3)"))
+
+
+async def test_stream_failed_command_with_binary_stderr_raises_command_error():
+    code = "import sys; sys.stderr.buffer.write(b'bad \\xff byte'); sys.exit(1)"
+    with pytest.raises(CommandError, match="bad \ufffd byte"):
+        await collect(python_cmd(code))
+
+
+async def test_stream_invalid_output_with_large_tail_raises_promptly():
+    # Far more output than the pipe buffer holds after the parse error
+    code = "import sys; sys.stdout.write('[{\"a\": 1},xx' + 'y' * 2_000_000)"
+    with pytest.raises(ParseError):
+        await asyncio.wait_for(collect(python_cmd(code), timeout=3), 10)
+
+
+async def test_stream_times_out():
+    code = "import time; print('['); time.sleep(10)"
+    with pytest.raises(CommandError, match="Timeout"):
+        await asyncio.wait_for(collect(python_cmd(code), timeout=1), 5)
+
+
+async def test_stream_closed_early_reaps_process():
+    code = "import json; print(json.dumps([{'i': i, 'p': 'x' * 100} for i in range(100_000)]))"
+    items = stream_json_items(python_cmd(code), ("item",), timeout=5)
+    async for item in items:
+        assert item["i"] == 0
+        break
+    await asyncio.wait_for(items.aclose(), 5)